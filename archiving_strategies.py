@@ -10,8 +10,72 @@ Provides interchangeable archiving strategies:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple, Optional, Any
+from functools import lru_cache
+from itertools import islice, product
+from typing import Dict, List, Tuple, Optional, Any, Callable, Iterable, Iterator
 import logging
+import queue
+import threading
+import time
+
+from database_repository import SAVE_BATCH_SIZE
+
+# Minimum seconds between progress log lines
+PROGRESS_LOG_INTERVAL = 2.0
+
+# BatchStrategy batches between WAL checkpoints
+CHECKPOINT_EVERY_BATCHES = 5
+
+# Batches BatchStrategy reads ahead of the one being archived
+PREFETCH_BATCHES = 2
+
+_END_OF_BATCHES = object()
+
+
+def _prefetch_batches(
+    articles: Iterable[Dict], batch_size: int, depth: int = PREFETCH_BATCHES
+) -> Iterator[List[Dict]]:
+    """
+    Yield batch_size chunks of articles, pulling upcoming chunks on a producer thread
+
+    When articles is lazy (e.g. discovered by crawling index pages), fetching
+    the next batch overlaps with archiving the current one. At most depth
+    batches are held in memory; producer errors are re-raised to the caller.
+    """
+    batches: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        remaining = iter(articles)
+        try:
+            while True:
+                batch = list(islice(remaining, batch_size))
+                if not batch or not put(batch):
+                    break
+        except Exception as e:
+            put(e)
+        put(_END_OF_BATCHES)
+
+    threading.Thread(target=produce, name="article-prefetch", daemon=True).start()
+    try:
+        while True:
+            item = batches.get()
+            if item is _END_OF_BATCHES:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
 
 
 class ArchivingStrategy(ABC):
@@ -20,7 +84,7 @@ class ArchivingStrategy(ABC):
     @abstractmethod
     def archive_articles(
         self,
-        articles: List[Dict],
+        articles: Iterable[Dict],
         date_str: str,
         archiver,  # WaybackArchiver instance
         repository,  # ArchiveRepository instance
@@ -31,7 +95,7 @@ class ArchivingStrategy(ABC):
         Archive articles using this strategy
 
         Args:
-            articles: List of article data to archive
+            articles: Article data to archive (any iterable, consumed once)
             date_str: Date string in YYYYMMDD format
             archiver: WaybackArchiver instance
             repository: ArchiveRepository instance
@@ -57,7 +121,7 @@ class SequentialStrategy(ArchivingStrategy):
 
     def archive_articles(
         self,
-        articles: List[Dict],
+        articles: Iterable[Dict],
         date_str: str,
         archiver,
         repository,
@@ -66,61 +130,66 @@ class SequentialStrategy(ArchivingStrategy):
     ) -> Tuple[int, int, int]:
         """Process articles sequentially"""
         found = archived = failed = 0
-        total = len(articles)
         logger = logging.getLogger(__name__)
 
-        for i, article in enumerate(articles):
-            url = article["url"]
-            found += 1
-
-            # Use archiver to save URL
-            result = archiver.archive_url(url, archiver.config)
-
-            # Save result to database
-            if "matched_keywords" in article:
-                # Keyword mode
-                article_record = repository.create_archive_record(
-                    article_url=url,
-                    wayback_url=result.wayback_url,
-                    archive_date=date_str,
-                    status=result.status,
-                    http_status=result.http_status,
-                    error_message=result.error,
-                    matched_keywords=",".join(article.get("matched_keywords", [])),
-                    checked_wayback=True,
-                    title_search_only=article.get("title_search_only", False),
-                    article_title=article.get("title"),
-                )
-            else:
-                # Regular mode
-                article_record = repository.create_archive_record(
-                    article_url=url,
-                    wayback_url=result.wayback_url,
-                    archive_date=date_str,
-                    status=result.status,
-                    http_status=result.http_status,
-                    error_message=result.error,
-                    checked_wayback=True,
-                )
-
-            repository.save_archive_record(article_record)
-
-            # Update statistics
-            with stats_lock:
+        pending = []
+        next_log = time.monotonic() + PROGRESS_LOG_INTERVAL
+
+        try:
+            for article in articles:
+                url = article["url"]
+                found += 1
+
+                # Use archiver to save URL
+                result = archiver.archive_url(url, archiver.config)
+
+                # Save result to database
+                matched_keywords = article.get("matched_keywords")
+                if matched_keywords is not None:
+                    # Keyword mode
+                    matched_str = ",".join(matched_keywords)
+                    article_record = repository.create_keyword_record(
+                        url,
+                        result,
+                        date_str,
+                        matched_str,
+                        article.get("title_search_only", False),
+                        article.get("title"),
+                    )
+                else:
+                    # Regular mode
+                    article_record = repository.create_regular_record(
+                        url, result, date_str
+                    )
+
+                pending.append(article_record)
+                if len(pending) >= SAVE_BATCH_SIZE:
+                    repository.save_archive_records_batch(pending)
+                    pending.clear()
+
+                # Update counts
                 if result:
                     archived += 1
                 else:
                     failed += 1
-                stats_dict["total_attempted"] = stats_dict.get("total_attempted", 0) + 1
 
-            # Progress logging
-            if "matched_keywords" in article and result:
-                logger.info(
-                    f"✅ {', '.join(article.get('matched_keywords', []))}: {url[:60]}..."
-                )
+                # Progress logging
+                if matched_keywords and result and logger.isEnabledFor(logging.INFO):
+                    logger.info("✅ %s: %s...", matched_str, url[:60])
+
+                now = time.monotonic()
+                if now >= next_log:
+                    logger.info("進度: %d 篇已處理...", found)
+                    next_log = now + PROGRESS_LOG_INTERVAL
+        finally:
+            # Keep whatever finished before an error
+            repository.save_archive_records_batch(pending)
 
-            if i % 10 == 0 or i == total - 1:
-                logger.info(f"進度: {i + 1}/{total} 篇已處理...")
+        logger.info(f"完成: {found} 篇已處理")
+
+        # Merge into shared statistics once
+        with stats_lock:
+            stats_dict["total_attempted"] = stats_dict.get("total_attempted", 0) + found
 
         return found, archived, failed
 
@@ -141,7 +210,7 @@ class ParallelStrategy(ArchivingStrategy):
 
     def archive_articles(
         self,
-        articles: List[Dict],
+        articles: Iterable[Dict],
         date_str: str,
         archiver,
         repository,
@@ -149,10 +218,9 @@ class ParallelStrategy(ArchivingStrategy):
         stats_lock,
     ) -> Tuple[int, int, int]:
         """Process articles in parallel"""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import ThreadPoolExecutor
 
         found = archived = failed = 0
-        total = len(articles)
         logger = logging.getLogger(__name__)
 
         def process_article(article: Dict) -> Tuple[str, bool, Optional[Any]]:
@@ -166,50 +234,59 @@ class ParallelStrategy(ArchivingStrategy):
                 logger.error(f"Error processing {url}: {e}")
                 return url, False, None
 
-        # Process in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(process_article, article): article
-                for article in articles
-            }
-            completed = 0
-
-            for future in as_completed(futures):
-                completed += 1
-                url, success, result = future.result()
-                found += 1
+        # Records are written from this thread only, in bulk
+        pending = []
+
+        next_log = time.monotonic() + PROGRESS_LOG_INTERVAL
+
+        try:
+            # Process in parallel
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Results stream back in submission order; order doesn't matter here
+                for url, success, result in executor.map(process_article, articles):
+                    found += 1
+
+                    # Queue result for the database
+                    article_record = repository.create_archive_record(
+                        article_url=url,
+                        wayback_url=getattr(result, "wayback_url", None)
+                        if result
+                        else None,
+                        archive_date=date_str,
+                        status="success" if success else "failed",
+                        http_status=getattr(result, "http_status", None)
+                        if result
+                        else None,
+                        error_message=getattr(result, "error", "Processing error")
+                        if result
+                        else "Processing error",
+                        checked_wayback=True,
+                    )
+                    pending.append(article_record)
+                    if len(pending) >= SAVE_BATCH_SIZE:
+                        repository.save_archive_records_batch(pending)
+                        pending.clear()
 
-                # Save result to database
-                article_record = repository.create_archive_record(
-                    article_url=url,
-                    wayback_url=getattr(result, "wayback_url", None)
-                    if result
-                    else None,
-                    archive_date=date_str,
-                    status="success" if success else "failed",
-                    http_status=getattr(result, "http_status", None)
-                    if result
-                    else None,
-                    error_message=getattr(result, "error", "Processing error")
-                    if result
-                    else "Processing error",
-                    checked_wayback=True,
-                )
-                repository.save_archive_record(article_record)
-
-                # Update statistics
-                with stats_lock:
+                    # Update counts
                     if success:
                         archived += 1
                     else:
                         failed += 1
-                    stats_dict["total_attempted"] = (
-                        stats_dict.get("total_attempted", 0) + 1
-                    )
 
-                # Progress logging
-                if completed % 10 == 0 or completed == total:
-                    logger.info(f"進度: {completed}/{total} 篇已處理...")
+                    # Progress logging
+                    now = time.monotonic()
+                    if now >= next_log:
+                        logger.info("進度: %d 篇已處理...", found)
+                        next_log = now + PROGRESS_LOG_INTERVAL
+        finally:
+            # Keep whatever finished before an error
+            repository.save_archive_records_batch(pending)
+
+        logger.info(f"完成: {found} 篇已處理")
+
+        # Merge into shared statistics once
+        with stats_lock:
+            stats_dict["total_attempted"] = stats_dict.get("total_attempted", 0) + found
 
         return found, archived, failed
 
@@ -225,12 +302,12 @@ class BatchStrategy(ArchivingStrategy):
     - Progress checkpointing
     """
 
-    def __init__(self, batch_size: int = 100):
+    def __init__(self, batch_size: int = 500):
         self.batch_size = batch_size
 
     def archive_articles(
         self,
-        articles: List[Dict],
+        articles: Iterable[Dict],
         date_str: str,
         archiver,
         repository,
@@ -239,49 +316,47 @@ class BatchStrategy(ArchivingStrategy):
     ) -> Tuple[int, int, int]:
         """Process articles in batches"""
         found = archived = failed = 0
-        total = len(articles)
         logger = logging.getLogger(__name__)
 
-        # Process in batches
-        for batch_start in range(0, total, self.batch_size):
-            batch_end = min(batch_start + self.batch_size, total)
-            batch_articles = articles[batch_start:batch_end]
-
+        # Process in batches while the next ones are read ahead
+        for batch_number, batch_articles in enumerate(
+            _prefetch_batches(articles, self.batch_size), 1
+        ):
             logger.info(
-                f"Processing batch {batch_start // self.batch_size + 1}: {len(batch_articles)} articles"
+                f"Processing batch {batch_number}: {len(batch_articles)} articles"
             )
 
+            # Collect records for a single bulk insert per batch
+            pending = []
+
             # Process this batch
-            for article in batch_articles:
-                url = article["url"]
-                found += 1
+            try:
+                for article in batch_articles:
+                    url = article["url"]
+                    found += 1
 
-                result = archiver.archive_url(url, archiver.config)
+                    result = archiver.archive_url(url, archiver.config)
 
-                # Create record (don't save immediately)
-                article_record = repository.create_archive_record(
-                    article_url=url,
-                    wayback_url=result.wayback_url,
-                    archive_date=date_str,
-                    status=result.status,
-                    http_status=result.http_status,
-                    error_message=result.error,
-                    checked_wayback=True,
-                )
-
-                # Batch save later
-                # repository.save_archive_record(article_record)
-                repository.save_archive_record(article_record)
+                    # Create record (saved with the rest of the batch)
+                    pending.append(
+                        repository.create_regular_record(url, result, date_str)
+                    )
 
-                # Update counts
-                if result:
-                    archived += 1
-                else:
-                    failed += 1
+                    # Update counts
+                    if result:
+                        archived += 1
+                    else:
+                        failed += 1
+            finally:
+                # Flush the whole batch in one transaction, even if one raised
+                repository.save_archive_records_batch(pending)
+
+            # Bound WAL growth on long runs
+            if batch_number % CHECKPOINT_EVERY_BATCHES == 0:
+                repository.checkpoint_wal()
 
             # Update batch progress
-            progress_pct = (batch_end / total) * 100
-            logger.info(f"Batch complete: {batch_end}/{total} ({progress_pct:.1f}%)")
+            logger.info(f"Batch complete: {found} articles processed")
 
         # Update final statistics
         with stats_lock:
@@ -290,6 +365,50 @@ class BatchStrategy(ArchivingStrategy):
         return found, archived, failed
 
 
+# Strategies hold no per-run state, so instances are shared across calls
+_SEQUENTIAL = SequentialStrategy()
+
+
+@lru_cache(maxsize=None)
+def _parallel_strategy(max_workers: int) -> ParallelStrategy:
+    return ParallelStrategy(max_workers=max_workers)
+
+
+@lru_cache(maxsize=None)
+def _batch_strategy(batch_size: int) -> BatchStrategy:
+    return BatchStrategy(batch_size=batch_size)
+
+
+_STRATEGY_BUILDERS: Dict[str, Callable[[Dict], ArchivingStrategy]] = {
+    "sequential": lambda config: _SEQUENTIAL,
+    "parallel": lambda config: _parallel_strategy(
+        config.get("parallel", {}).get("max_workers", 3)
+    ),
+    "batch": lambda config: _batch_strategy(config.get("batch_size", 500)),
+}
+
+
+def _default_strategy_for(
+    keywords_enabled: bool, search_content: bool, parallel_enabled: bool
+) -> str:
+    if keywords_enabled and search_content:
+        # Content search should be sequential due to rate limiting
+        return "sequential"
+    elif parallel_enabled and not keywords_enabled:
+        # Title-only filtering can be parallel
+        return "parallel"
+    else:
+        # Default to safe sequential approach
+        return "sequential"
+
+
+# (keywords.enabled, keywords.search_content, parallel.enabled) -> strategy type
+_DEFAULT_STRATEGY_BY_FLAGS: Dict[Tuple[bool, bool, bool], str] = {
+    flags: _default_strategy_for(*flags)
+    for flags in product((False, True), repeat=3)
+}
+
+
 class StrategyFactory:
     """Factory for creating archiving strategies"""
 
@@ -305,22 +424,12 @@ class StrategyFactory:
             config: Configuration dictionary
 
         Returns:
-            ArchivingStrategy instance
+            ArchivingStrategy instance (shared between calls with equal settings)
         """
-        if strategy_type == "sequential":
-            return SequentialStrategy()
-        elif strategy_type == "parallel":
-            max_workers = 3
-            if config and "parallel" in config:
-                max_workers = config["parallel"].get("max_workers", 3)
-            return ParallelStrategy(max_workers=max_workers)
-        elif strategy_type == "batch":
-            batch_size = 100
-            if config:
-                batch_size = config.get("batch_size", 100)
-            return BatchStrategy(batch_size=batch_size)
-        else:
+        builder = _STRATEGY_BUILDERS.get(strategy_type)
+        if builder is None:
             raise ValueError(f"Unknown strategy type: {strategy_type}")
+        return builder(config or {})
 
     @staticmethod
     def get_default_strategy(config: Dict) -> str:
@@ -333,19 +442,13 @@ class StrategyFactory:
         Returns:
             Recommended strategy type
         """
-        keywords_enabled = config.get("keywords", {}).get("enabled", False)
-        search_content = config.get("keywords", {}).get("search_content", False)
-        parallel_enabled = config.get("parallel", {}).get("enabled", False)
-
-        if keywords_enabled and search_content:
-            # Content search should be sequential due to rate limiting
-            return "sequential"
-        elif parallel_enabled and not keywords_enabled:
-            # Title-only filtering can be parallel
-            return "parallel"
-        else:
-            # Default to safe sequential approach
-            return "sequential"
+        keywords = config.get("keywords", {})
+        flags = (
+            bool(keywords.get("enabled", False)),
+            bool(keywords.get("search_content", False)),
+            bool(config.get("parallel", {}).get("enabled", False)),
+        )
+        return _DEFAULT_STRATEGY_BY_FLAGS[flags]
 
 
 # Backward compatibility wrapper
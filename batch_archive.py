@@ -14,27 +14,100 @@ Usage:
 """
 
 import argparse
+import calendar
 import sqlite3
 import sys
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Only writes for batches never seen before, so a crash mid-batch stays visible
+INSERT_PROGRESS_SQL = """
+    INSERT OR IGNORE INTO batch_progress
+    (batch_id, start_date, end_date, status, started_at)
+    VALUES (?, ?, ?, 'in_progress', ?)
+"""
+
+# Final state of a batch, written once when it completes or fails
+SAVE_RESULT_SQL = """
+    INSERT OR REPLACE INTO batch_progress
+    (batch_id, start_date, end_date, status, articles_found, articles_archived,
+     articles_failed, error_message, started_at, completed_at, execution_time)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
+"""
+
+
+# Seconds between the start of consecutive batch requests
+BATCH_MIN_INTERVAL = 30
+BATCH_MAX_INTERVAL = 600
 
 
 class BatchArchiver:
     def __init__(self, endpoint_url: str, db_path: str = "hkga_archive.db"):
         self.endpoint = endpoint_url
         self.db_path = db_path
+
+        # Minimum spacing between batch requests (backs off on HTTP 429)
+        self._min_interval = BATCH_MIN_INTERVAL
+        self._last_request = 0.0
+
+        # Single connection for the archiver's lifetime (autocommit mode)
+        self.conn = sqlite3.connect(
+            db_path, isolation_level=None, check_same_thread=False
+        )
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+
+        # Shared session so batches reuse the TCP/TLS connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            max_retries=Retry(
+                total=5,
+                # Never resubmit a batch the endpoint may still be running:
+                # no read retries, and only statuses that mean it was refused
+                read=0,
+                backoff_factor=2,
+                status_forcelist=[429, 503],
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip"})
+
         self.setup_database()
 
+    def close(self):
+        """Close the HTTP session and database connection"""
+        self.session.close()
+        self.conn.close()
+
+    def _wait_for_request_slot(self):
+        """Sleep only for whatever is left of the minimum interval"""
+        wait = self._min_interval - (time.monotonic() - self._last_request)
+        if wait > 0:
+            print(f"⏳ Waiting {wait:.0f}s before next batch...")
+            time.sleep(wait)
+        self._last_request = time.monotonic()
+
+    def _adjust_interval(self, status_code: int):
+        """Double the interval when rate limited, relax it again on success"""
+        if status_code == 429:
+            self._min_interval = min(self._min_interval * 2, BATCH_MAX_INTERVAL)
+        elif status_code == 200:
+            self._min_interval = max(self._min_interval / 2, BATCH_MIN_INTERVAL)
+
     def setup_database(self):
         """Create progress tracking table if needed"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        self.conn.execute("""
             CREATE TABLE IF NOT EXISTS batch_progress (
                 batch_id TEXT PRIMARY KEY,
                 start_date TEXT,
@@ -49,37 +122,36 @@ class BatchArchiver:
                 execution_time REAL
             )
         """)
-
-        conn.commit()
-        conn.close()
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_batch_status ON batch_progress(status)"
+        )
 
     def generate_monthly_batches(
         self, start_date: datetime, end_date: datetime
-    ) -> List[Tuple[str, str]]:
+    ) -> List[Tuple[str, str, str]]:
         """Generate monthly date ranges from start to end"""
         batches = []
-        current = start_date.replace(day=1)
-
-        while current <= end_date:
-            # Last day of current month
-            if current.month == 12:
-                next_month = current.replace(year=current.year + 1, month=1)
-            else:
-                next_month = current.replace(month=current.month + 1)
+        first_month = start_date.year * 12 + start_date.month - 1
+        last_month = end_date.year * 12 + end_date.month - 1
 
-            month_end = next_month - timedelta(days=1)
+        for month_index in range(first_month, last_month + 1):
+            year, month = divmod(month_index, 12)
+            month += 1
 
-            # Don't go beyond end_date
-            if month_end > end_date:
-                month_end = end_date
+            # Last day of month, but don't go beyond end_date
+            if month_index == last_month:
+                last_day = end_date.day
+            else:
+                last_day = calendar.monthrange(year, month)[1]
 
-            batch_id = current.strftime("%Y%m")
             batches.append(
-                (batch_id, current.strftime("%Y-%m-%d"), month_end.strftime("%Y-%m-%d"))
+                (
+                    f"{year:04d}{month:02d}",
+                    f"{year:04d}-{month:02d}-01",
+                    f"{year:04d}-{month:02d}-{last_day:02d}",
+                )
             )
 
-            current = next_month
-
         return batches
 
     def get_pending_batches(
@@ -88,16 +160,28 @@ class BatchArchiver:
         """Get batches that haven't been completed yet"""
         all_batches = self.generate_monthly_batches(start_date, end_date)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT batch_id FROM batch_progress WHERE status='completed'")
-        completed = {row[0] for row in cursor.fetchall()}
-
-        conn.close()
+        # Anti-join candidate batches against completed ones in SQL
+        self.conn.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS batch_candidates (
+                batch_id TEXT PRIMARY KEY,
+                start_date TEXT,
+                end_date TEXT
+            )
+        """)
+        self.conn.execute("DELETE FROM batch_candidates")
+        self.conn.executemany(
+            "INSERT INTO batch_candidates VALUES (?, ?, ?)", all_batches
+        )
 
-        pending = [batch for batch in all_batches if batch[0] not in completed]
-        return pending
+        cursor = self.conn.execute("""
+            SELECT c.batch_id, c.start_date, c.end_date
+            FROM batch_candidates c
+            LEFT JOIN batch_progress b
+                ON b.batch_id = c.batch_id AND b.status = 'completed'
+            WHERE b.batch_id IS NULL
+            ORDER BY c.batch_id
+        """)
+        return cursor.fetchall()
 
     def archive_batch(self, batch_id: str, start_date: str, end_date: str) -> Dict:
         """Archive a single monthly batch"""
@@ -105,24 +189,17 @@ class BatchArchiver:
         print(f"Archiving batch: {batch_id} ({start_date} to {end_date})")
         print(f"{'=' * 60}")
 
-        # Mark as in progress
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO batch_progress 
-            (batch_id, start_date, end_date, status, started_at)
-            VALUES (?, ?, ?, 'in_progress', CURRENT_TIMESTAMP)
-        """,
-            (batch_id, start_date, end_date),
+        # Mark as in progress (same format as CURRENT_TIMESTAMP)
+        started_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        self.conn.execute(
+            INSERT_PROGRESS_SQL, (batch_id, start_date, end_date, started_at)
         )
-        conn.commit()
-        conn.close()
 
+        self._wait_for_request_slot()
         start_time = time.time()
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 json={
                     "mode": "range",
@@ -132,6 +209,7 @@ class BatchArchiver:
                 },
                 timeout=86400,  # 24 hours max per batch
             )
+            self._adjust_interval(response.status_code)
 
             result = response.json()
 
@@ -140,29 +218,21 @@ class BatchArchiver:
                 execution_time = time.time() - start_time
 
                 # Update as completed
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    UPDATE batch_progress 
-                    SET status='completed',
-                        articles_found=?,
-                        articles_archived=?,
-                        articles_failed=?,
-                        completed_at=CURRENT_TIMESTAMP,
-                        execution_time=?
-                    WHERE batch_id=?
-                """,
+                self.conn.execute(
+                    SAVE_RESULT_SQL,
                     (
+                        batch_id,
+                        start_date,
+                        end_date,
+                        "completed",
                         stats.get("found", 0),
                         stats.get("archived", 0),
                         stats.get("failed", 0),
+                        None,
+                        started_at,
                         execution_time,
-                        batch_id,
                     ),
                 )
-                conn.commit()
-                conn.close()
 
                 print(f"✅ Batch {batch_id} completed:")
                 print(f"   Found: {stats.get('found', 0)}")
@@ -180,31 +250,28 @@ class BatchArchiver:
             execution_time = time.time() - start_time
 
             # Mark as failed
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                UPDATE batch_progress 
-                SET status='failed',
-                    error_message=?,
-                    completed_at=CURRENT_TIMESTAMP,
-                    execution_time=?
-                WHERE batch_id=?
-            """,
-                (str(e), execution_time, batch_id),
+            self.conn.execute(
+                SAVE_RESULT_SQL,
+                (
+                    batch_id,
+                    start_date,
+                    end_date,
+                    "failed",
+                    0,
+                    0,
+                    0,
+                    str(e),
+                    started_at,
+                    execution_time,
+                ),
             )
-            conn.commit()
-            conn.close()
 
             print(f"❌ Batch {batch_id} failed: {e}")
             return {"status": "failed", "batch_id": batch_id, "error": str(e)}
 
     def get_progress_summary(self) -> Dict:
         """Get overall progress summary"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        cursor = self.conn.execute("""
             SELECT status, COUNT(*), SUM(articles_archived)
             FROM batch_progress
             GROUP BY status
@@ -231,7 +298,6 @@ class BatchArchiver:
             elif status == "failed":
                 summary["failed"] = count
 
-        conn.close()
         return summary
 
     def run(self, start_date: datetime, end_date: datetime, retry_failed: bool = False):
@@ -278,11 +344,6 @@ class BatchArchiver:
                 print(f"📝 Checkpoint after {i} batches")
                 print(f"{'=' * 60}")
 
-            # Rate limiting between batches (30 seconds to be safe)
-            if i < len(batches):
-                print("⏳ Waiting 30s before next batch...")
-                time.sleep(30)
-
         # Final summary
         print(f"\n{'=' * 60}")
         print("🎉 BATCH ARCHIVING COMPLETE!")
@@ -332,7 +393,10 @@ def main():
         archiver = BatchArchiver(args.endpoint)
 
         # Run batch archiving
-        archiver.run(start_date, end_date, retry_failed=args.retry_failed)
+        try:
+            archiver.run(start_date, end_date, retry_failed=args.retry_failed)
+        finally:
+            archiver.close()
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -1,12 +1,33 @@
 #!/usr/bin/env python3
 """Compare brute-force vs index-based URL discovery"""
 
-from mingpao_hkga_archiver import MingPaoHKGAArchiver
+from mingpao_hkga_archiver import MingPaoArchiver
 from datetime import datetime
 import time
 
+RUNS = 5  # Report best-of-N timings
+
+
+def safe_div(a: float, b: float) -> float:
+    """Divide, returning infinity instead of raising on a zero divisor"""
+    return a / b if b else float("inf")
+
+
+def best_of(func, runs: int = RUNS):
+    """Run func several times, returning its last result and the fastest time (s)"""
+    best_ns = None
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter_ns()
+        result = func()
+        elapsed_ns = time.perf_counter_ns() - start
+        if best_ns is None or elapsed_ns < best_ns:
+            best_ns = elapsed_ns
+    return result, best_ns / 1e9
+
+
 # Create archiver instance
-archiver = MingPaoHKGAArchiver("config.json")
+archiver = MingPaoArchiver("config.json")
 test_date = datetime(2026, 1, 13)
 
 print(f"\n{'=' * 70}")
@@ -16,12 +37,12 @@ print(f"{'=' * 70}\n")
 # Method 1: Index-based (new)
 print("🆕 INDEX-BASED DISCOVERY (Recommended)")
 print("-" * 70)
-archiver.config["use_index_page"] = True
-start = time.time()
-index_urls = archiver.generate_article_urls(test_date)
-index_time = time.time() - start
-print(f"   URLs found: {len(index_urls)}")
-print(f"   Time taken: {index_time:.2f}s")
+index_urls, index_time = best_of(
+    lambda: archiver.url_generator.index_strategy.generate_urls(test_date)
+)
+index_count = len(index_urls)
+print(f"   URLs found: {index_count}")
+print(f"   Time taken: {index_time:.2f}s (best of {RUNS})")
 print("   Method: Crawl index page HTML")
 print("   Accuracy: 100% (all URLs are real articles)")
 
@@ -30,31 +51,33 @@ print("\n" + "=" * 70 + "\n")
 # Method 2: Brute-force (old)
 print("🔧 BRUTE-FORCE GENERATION (Legacy)")
 print("-" * 70)
-archiver.config["use_index_page"] = False
-start = time.time()
-brute_urls = archiver._generate_urls_bruteforce(test_date)
-brute_time = time.time() - start
-print(f"   URLs generated: {len(brute_urls)}")
-print(f"   Time taken: {brute_time:.2f}s")
+brute_urls, brute_time = best_of(
+    lambda: archiver.url_generator.brute_force_strategy.generate_urls(test_date)
+)
+brute_count = len(brute_urls)
+print(f"   URLs generated: {brute_count}")
+print(f"   Time taken: {brute_time:.2f}s (best of {RUNS})")
 print("   Method: Generate all possible combinations")
-print(f"   Accuracy: ~{len(index_urls)/len(brute_urls)*100:.1f}% (most URLs return 404)")
+hit_rate = safe_div(index_count, brute_count) * 100
+print(f"   Accuracy: ~{hit_rate:.1f}% (most URLs return 404)")
 
 print("\n" + "=" * 70)
 print("EFFICIENCY GAINS")
 print("=" * 70)
-reduction = (1 - len(index_urls) / len(brute_urls)) * 100
+reduction = 100 - hit_rate
+saved_per_day = brute_count - index_count
 print(f"   📉 URL reduction: {reduction:.1f}%")
-print(f"   ⚡ Speed: {brute_time/index_time:.1f}x faster per URL")
-print(f"   💾 HTTP requests saved: {len(brute_urls) - len(index_urls)} per day")
-print(f"   🎯 Accuracy improvement: {100 - len(index_urls)/len(brute_urls)*100:.1f}% fewer 404s")
+print(f"   ⚡ Speed: {safe_div(brute_time, index_time):.1f}x faster per URL")
+print(f"   💾 HTTP requests saved: {saved_per_day} per day")
+print(f"   🎯 Accuracy improvement: {reduction:.1f}% fewer 404s")
 
 # Calculate monthly savings
 days_per_month = 30
-monthly_savings = (len(brute_urls) - len(index_urls)) * days_per_month
+monthly_savings = saved_per_day * days_per_month
 print(f"\n   📊 Monthly HTTP request savings: ~{monthly_savings:,} requests")
 print(f"   ⏱️  Time saved per month: ~{(index_time - brute_time) * days_per_month:.0f}s")
 
 print("\n" + "=" * 70 + "\n")
 
 # Close database
-archiver.conn.close()
+archiver.close()
@@ -10,8 +10,35 @@ Provides type-safe configuration management:
 - Nested configuration support
 """
 
-from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field, validator
+import json
+import os
+import unicodedata
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field, ValidationError, root_validator, validator
+
+from keyword_filter import DEFAULT_CACHE_TTL, DEFAULT_PARALLEL_WORKERS
+
+try:
+    import orjson  # Optional: C JSON codec, several times faster than stdlib json
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode obj as indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _parse_iso_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD string already matched by the Field pattern"""
+    # Slicing skips strptime's format interpretation; datetime() still
+    # rejects impossible dates such as 2025-02-30
+    return datetime(int(value[:4]), int(value[5:7]), int(value[8:10]))
 
 
 class LoggingConfig(BaseModel):
@@ -35,6 +62,8 @@ class ArchivingConfig(BaseModel):
     timeout: int = Field(default=30, gt=0, le=300)
     max_retries: int = Field(default=3, ge=0, le=10)
     retry_delay: int = Field(default=10, gt=0, le=60)
+    max_concurrent_per_host: int = Field(default=4, ge=1, le=32)
+    title_fetch_bytes: int = Field(default=65536, ge=0)
 
 
 class KeywordsConfig(BaseModel):
@@ -48,8 +77,13 @@ class KeywordsConfig(BaseModel):
     normalization: str = Field(default="NFC", pattern="^(NFC|NFD|NFKC|NFKD)$")
     logic: str = Field(default="or", pattern="^(or|and)$")
     search_content: bool = Field(default=False)
-    parallel_workers: int = Field(default=2, ge=1, le=10)
+    parallel_workers: int = Field(default=DEFAULT_PARALLEL_WORKERS, ge=1, le=32)
+    async_concurrency: int = Field(default=16, ge=1, le=64)
+    async_fetch: bool = Field(default=False)  # Title pass on aiohttp, if installed
     wayback_first: bool = Field(default=True)
+    wayback_probe: bool = Field(default=False)
+    cache_path: Optional[str] = Field(default=None)
+    cache_ttl: Optional[int] = Field(default=DEFAULT_CACHE_TTL, ge=0)
 
     @validator("terms")
     def validate_terms(cls, v):
@@ -57,6 +91,18 @@ class KeywordsConfig(BaseModel):
             raise ValueError("Keyword terms cannot be empty when keywords are enabled")
         return v
 
+    @root_validator(skip_on_failure=True)
+    def normalize_terms(cls, values):
+        """Unicode-normalize terms once at load and drop duplicates (first spelling wins)"""
+        form = values["normalization"]
+        fold = not values["case_sensitive"]
+        unique: Dict[str, str] = {}
+        for term in values["terms"]:
+            term = unicodedata.normalize(form, term)
+            unique.setdefault(term.casefold() if fold else term, term)
+        values["terms"] = list(unique.values())
+        return values
+
 
 class ParallelConfig(BaseModel):
     """Parallel processing configuration"""
@@ -75,10 +121,8 @@ class DateRangeConfig(BaseModel):
     @validator("end")
     def validate_date_range(cls, v, values):
         if "start" in values:
-            from datetime import datetime
-
-            start_date = datetime.strptime(values["start"], "%Y-%m-%d")
-            end_date = datetime.strptime(v, "%Y-%m-%d")
+            start_date = _parse_iso_date(values["start"])
+            end_date = _parse_iso_date(v)
             if end_date < start_date:
                 raise ValueError("End date must be after start date")
         return v
@@ -120,26 +164,26 @@ class MingPaoConfig(BaseModel):
             FileNotFoundError: If config file doesn't exist
             ValidationError: If config is invalid
         """
-        import json
-        from pathlib import Path
-
-        config_file = Path(config_path)
-
-        if not config_file.exists():
+        try:
+            stat = os.stat(config_path)
+        except FileNotFoundError:
             # Return default config if file doesn't exist
             return cls()
 
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
-
-            return cls(**config_data)
-
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in config file: {e}")
+            config = _load_validated(
+                cls, os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size
+            )
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise ValueError(f"Invalid JSON in config file: {e}")
+            raise ValueError(f"Error loading config file: {e}")
         except Exception as e:
             raise ValueError(f"Error loading config file: {e}")
 
+        # The cached instance is shared; hand out a copy callers may mutate
+        return config.model_copy(deep=True)
+
     def save_to_file(self, config_path: str) -> bool:
         """
         Save configuration to JSON file
@@ -150,15 +194,12 @@ class MingPaoConfig(BaseModel):
         Returns:
             True if successful, False otherwise
         """
-        import json
-        from pathlib import Path
-
         try:
             config_file = Path(config_path)
             config_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(config_file, "w", encoding="utf-8") as f:
-                json.dump(self.dict(), f, indent=2, ensure_ascii=False)
+            with open(config_file, "wb") as f:
+                f.write(_json_dumps(self.dict()))
 
             return True
         except Exception:
@@ -176,28 +217,35 @@ class MingPaoConfig(BaseModel):
         """
         try:
             file_config = self.load_from_file(config_path)
-            current_dict = self.dict()
-            file_dict = file_config.dict()
-
-            # Deep merge file config over current
-            self._deep_merge(current_dict, file_dict)
-
-            return MingPaoConfig(**current_dict)
         except FileNotFoundError:
             # File doesn't exist, return current config
             return self
 
-    def _deep_merge(self, base_dict: Dict, update_dict: Dict):
-        """Recursively merge update_dict into base_dict"""
-        for key, value in update_dict.items():
-            if (
-                key in base_dict
-                and isinstance(base_dict[key], dict)
-                and isinstance(value, dict)
-            ):
-                self._deep_merge(base_dict[key], value)
-            else:
-                base_dict[key] = value
+        # Only fields the file actually sets override the current values.
+        # Both configs are validated, so sub-models are copied with updates
+        # and assembled without another validation pass.
+        file_fields = file_config.model_fields_set
+        merged = {}
+        for name in type(self).model_fields:
+            current = getattr(self, name)
+            update = None
+            if name in file_fields:
+                override = getattr(file_config, name)
+                if not (
+                    isinstance(current, BaseModel) and isinstance(override, BaseModel)
+                ):
+                    merged[name] = override
+                    continue
+                update = override.model_dump(exclude_unset=True)
+
+            # Copy sub-models so the result never shares mutable state with self
+            if isinstance(current, BaseModel):
+                current = current.model_copy(update=update, deep=True)
+            merged[name] = current
+
+        return MingPaoConfig.model_construct(
+            _fields_set=self.model_fields_set | file_fields, **merged
+        )
 
     def get_effective_date_range(self) -> Optional[DateRangeConfig]:
         """Get effective date range from config or defaults"""
@@ -205,8 +253,6 @@ class MingPaoConfig(BaseModel):
             return self.date_range
 
         # Return a default date range if none specified
-        from datetime import datetime, timedelta
-
         today = datetime.now()
         start_date = today - timedelta(days=7)
         end_date = today
@@ -216,7 +262,7 @@ class MingPaoConfig(BaseModel):
         )
 
     def is_keywords_enabled(self) -> bool:
-        """Check if keyword filtering is enabled"""
+        """Check if keyword filtering is enabled (and has terms)"""
         return self.keywords.enabled and bool(self.keywords.terms)
 
     def is_parallel_enabled(self) -> bool:
@@ -233,6 +279,21 @@ class MingPaoConfig(BaseModel):
             return self.archiving.rate_limit_delay
 
 
+@lru_cache(maxsize=8)
+def _load_validated(
+    model: type, config_path: str, mtime_ns: int, size: int
+) -> MingPaoConfig:
+    """
+    Parse and validate a config file, memoized on its path, mtime and size
+
+    An edited file gets a new (mtime_ns, size) key, so stale entries are never
+    returned; they simply age out of the cache.
+    """
+    with open(config_path, "rb") as f:
+        # pydantic-core parses and validates in one pass, no intermediate dict
+        return model.model_validate_json(f.read())
+
+
 class ConfigValidator:
     """Utility class for configuration validation"""
 
@@ -309,7 +370,8 @@ def load_config(config_path: str = "config.json") -> Dict:
     """
     Load configuration for backward compatibility
 
-    Returns the raw dictionary format for existing code
+    Returns the raw dictionary format for existing code. config.json is
+    hand-edited, so it goes through the validated (and memoized) loader.
     """
     try:
         config = MingPaoConfig.load_from_file(config_path)
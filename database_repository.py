@@ -13,14 +13,17 @@ import sqlite3
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set
 import logging
 from dataclasses import dataclass
 
+# Records callers buffer before a save_archive_records_batch write
+SAVE_BATCH_SIZE = 50
 
-@dataclass
+
+@dataclass(slots=True)
 class ArchiveRecord:
-    """Data model for archive records"""
+    """Data model for archive records (slotted: runs buffer thousands before a flush)"""
 
     article_url: str
     wayback_url: Optional[str] = None
@@ -34,8 +37,23 @@ class ArchiveRecord:
     article_title: Optional[str] = None
     id: Optional[int] = None
 
+    def to_row(self) -> tuple:
+        """Column values in archive_records insert order"""
+        return (
+            self.article_url,
+            self.wayback_url,
+            self.archive_date,
+            self.status,
+            self.http_status,
+            self.error_message,
+            self.matched_keywords,
+            self.checked_wayback,
+            self.title_search_only,
+            self.article_title,
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class DailyProgress:
     """Data model for daily progress tracking"""
 
@@ -50,7 +68,7 @@ class DailyProgress:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchProgress:
     """Data model for batch progress tracking"""
 
@@ -78,11 +96,35 @@ class ArchiveRepository:
     - Proper transaction handling
     """
 
+    # Shared by the single and bulk save paths so both reuse one cached statement
+    _SAVE_RECORD_SQL = """
+        INSERT OR REPLACE INTO archive_records
+        (article_url, wayback_url, archive_date, status, http_status,
+         error_message, matched_keywords, checked_wayback, title_search_only,
+         article_title, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    """
+
+    # Secondary indexes on archive_records. They serve reports and date or
+    # status lookups, never the INSERT OR REPLACE dedup (article_url's UNIQUE
+    # constraint does that), so a backfill can drop them and rebuild once
+    _ANALYTICAL_INDEXES = {
+        "idx_status": "archive_records(status)",
+        "idx_date": "archive_records(archive_date)",
+        "idx_keywords": "archive_records(matched_keywords)",
+        "idx_url_status": "archive_records(article_url, status)",
+        # Composite indexes for common query patterns (NEW)
+        "idx_date_status": "archive_records(archive_date, status)",
+        "idx_created_status": "archive_records(created_at, status)",
+        "idx_status_date": "archive_records(status, archive_date)",
+    }
+
     def __init__(self, db_path: str = "hkga_archive.db"):
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
         self._lock = threading.Lock()
         self._thread_local = threading.local()  # Thread-local storage for connections (NEW)
+        self._connections: List[sqlite3.Connection] = []  # Every open connection, for close()
         self._ensure_database()
 
     def _ensure_database(self):
@@ -142,21 +184,70 @@ class ArchiveRepository:
                 )
             """)
 
-            # Create indexes for performance
-            indexes = [
-                "CREATE INDEX IF NOT EXISTS idx_status ON archive_records(status)",
-                "CREATE INDEX IF NOT EXISTS idx_date ON archive_records(archive_date)",
-                "CREATE INDEX IF NOT EXISTS idx_keywords ON archive_records(matched_keywords)",
-                "CREATE UNIQUE INDEX IF NOT EXISTS idx_article_url ON archive_records(article_url)",
-                "CREATE INDEX IF NOT EXISTS idx_url_status ON archive_records(article_url, status)",
-                # Composite indexes for common query patterns (NEW)
-                "CREATE INDEX IF NOT EXISTS idx_date_status ON archive_records(archive_date, status)",
-                "CREATE INDEX IF NOT EXISTS idx_created_status ON archive_records(created_at, status)",
-                "CREATE INDEX IF NOT EXISTS idx_status_date ON archive_records(status, archive_date)",
+            # Per-status row counts, kept current by triggers so statistics
+            # never have to scan archive_records
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'archive_counts'"
+            )
+            backfill_counts = cursor.fetchone() is None
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS archive_counts (
+                    status TEXT PRIMARY KEY,
+                    n INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            if backfill_counts:
+                cursor.execute("""
+                    INSERT INTO archive_counts (status, n)
+                    SELECT status, COUNT(*) FROM archive_records
+                    WHERE status IS NOT NULL
+                    GROUP BY status
+                """)
+
+            triggers = [
+                """
+                CREATE TRIGGER IF NOT EXISTS trg_archive_counts_insert
+                AFTER INSERT ON archive_records WHEN NEW.status IS NOT NULL
+                BEGIN
+                    INSERT INTO archive_counts (status, n) VALUES (NEW.status, 1)
+                    ON CONFLICT(status) DO UPDATE SET n = n + 1;
+                END
+                """,
+                """
+                CREATE TRIGGER IF NOT EXISTS trg_archive_counts_delete
+                AFTER DELETE ON archive_records WHEN OLD.status IS NOT NULL
+                BEGIN
+                    UPDATE archive_counts SET n = n - 1 WHERE status = OLD.status;
+                END
+                """,
+                """
+                CREATE TRIGGER IF NOT EXISTS trg_archive_counts_update
+                AFTER UPDATE OF status ON archive_records
+                WHEN OLD.status IS NOT NEW.status
+                BEGIN
+                    UPDATE archive_counts SET n = n - 1 WHERE status = OLD.status;
+                    INSERT INTO archive_counts (status, n)
+                    SELECT NEW.status, 1 WHERE NEW.status IS NOT NULL
+                    ON CONFLICT(status) DO UPDATE SET n = n + 1;
+                END
+                """,
             ]
 
-            for index_sql in indexes:
-                cursor.execute(index_sql)
+            for trigger_sql in triggers:
+                cursor.execute(trigger_sql)
+
+            # Create indexes for performance
+            for name, definition in self._ANALYTICAL_INDEXES.items():
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+
+            # Partial index: get_completed_batches only ever asks for completed rows
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_batch_completed ON batch_progress(batch_id) WHERE status = 'completed'"
+            )
+
+            # article_url's UNIQUE constraint already has an implicit index;
+            # drop the duplicate older databases were created with
+            cursor.execute("DROP INDEX IF EXISTS idx_article_url")
 
             conn.commit()
             self.logger.debug("Database schema initialized")
@@ -172,16 +263,24 @@ class ArchiveRepository:
         """
         # Check if current thread already has a connection (connection pooling)
         if not hasattr(self._thread_local, 'connection') or self._thread_local.connection is None:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=256
+            )
+            conn.row_factory = sqlite3.Row  # Rows addressable by column name
             # Character encoding
             conn.execute("PRAGMA encoding = 'UTF-8'")
             # Performance optimizations
             conn.execute("PRAGMA journal_mode = WAL")      # Write-ahead logging for better concurrency
             conn.execute("PRAGMA synchronous = NORMAL")    # ~2x faster writes, still safe
-            conn.execute("PRAGMA cache_size = 10000")      # Larger page cache (40MB)
+            conn.execute("PRAGMA cache_size = -65536")     # 64MB page cache (negative = KiB)
+            conn.execute("PRAGMA mmap_size = 268435456")   # Memory-map up to 256MB for reads
             conn.execute("PRAGMA temp_store = MEMORY")     # Temporary tables in RAM
+            conn.execute("PRAGMA busy_timeout = 5000")     # Wait on writer locks instead of failing
+            conn.execute("PRAGMA recursive_triggers = ON") # REPLACE deletions fire count triggers
             conn.execute("PRAGMA query_only = FALSE")      # Allow writes (default)
             self._thread_local.connection = conn
+            with self._lock:
+                self._connections.append(conn)
             self.logger.debug(f"Created new connection for thread {threading.current_thread().name}")
         return self._thread_local.connection
 
@@ -193,8 +292,12 @@ class ArchiveRepository:
         the database connection for the thread.
         """
         if hasattr(self._thread_local, 'connection') and self._thread_local.connection:
+            conn = self._thread_local.connection
             try:
-                self._thread_local.connection.close()
+                with self._lock:
+                    if conn in self._connections:
+                        self._connections.remove(conn)
+                conn.close()
                 self._thread_local.connection = None
                 self.logger.debug(f"Closed connection for thread {threading.current_thread().name}")
             except Exception as e:
@@ -202,38 +305,92 @@ class ArchiveRepository:
 
     # Archive Records Operations
 
+    def create_archive_record(self, **fields) -> ArchiveRecord:
+        """Build an ArchiveRecord without saving it (pair with save_archive_records_batch)"""
+        return ArchiveRecord(**fields)
+
+    def create_regular_record(
+        self,
+        article_url: str,
+        result,
+        archive_date: str,
+        article_title: Optional[str] = None,
+    ) -> ArchiveRecord:
+        """Build a record for an ArchiveResult archived without keyword filtering"""
+        return ArchiveRecord(
+            article_url,
+            result.wayback_url,
+            archive_date,
+            result.status,
+            result.http_status,
+            result.error,
+            None,
+            True,
+            False,
+            article_title,
+        )
+
+    def create_keyword_record(
+        self,
+        article_url: str,
+        result,
+        archive_date: str,
+        matched_keywords: str,
+        title_search_only: bool,
+        article_title: Optional[str],
+    ) -> ArchiveRecord:
+        """Build a record for an ArchiveResult that matched keyword filtering"""
+        return ArchiveRecord(
+            article_url,
+            result.wayback_url,
+            archive_date,
+            result.status,
+            result.http_status,
+            result.error,
+            matched_keywords,
+            True,
+            title_search_only,
+            article_title,
+        )
+
     def save_archive_record(self, record: ArchiveRecord) -> bool:
         """Save or update an archive record"""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO archive_records
-                    (article_url, wayback_url, archive_date, status, http_status, 
-                     error_message, matched_keywords, checked_wayback, title_search_only, 
-                     article_title, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """,
-                    (
-                        record.article_url,
-                        record.wayback_url,
-                        record.archive_date,
-                        record.status,
-                        record.http_status,
-                        record.error_message,
-                        record.matched_keywords,
-                        record.checked_wayback,
-                        record.title_search_only,
-                        record.article_title,
-                    ),
-                )
+                cursor.execute(self._SAVE_RECORD_SQL, record.to_row())
                 conn.commit()
                 return True
         except Exception as e:
             self.logger.error(f"Failed to save archive record: {e}")
             return False
 
+    def save_archive_records(self, records: Iterable[ArchiveRecord]) -> int:
+        """
+        Save archive records with one executemany in a single transaction
+
+        Records are streamed straight into executemany, so any iterable
+        (including a generator) works without building an intermediate list.
+
+        Args:
+            records: ArchiveRecord objects to save
+
+        Returns:
+            Number of rows written (0 on failure)
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    self._SAVE_RECORD_SQL,
+                    (record.to_row() for record in records),
+                )
+                self.logger.debug(f"Batch saved {cursor.rowcount} archive records")
+                return cursor.rowcount
+        except Exception as e:
+            self.logger.error(f"Failed to save batch archive records: {e}")
+            return 0
+
     def save_archive_records_batch(self, records: List[ArchiveRecord]) -> bool:
         """
         Save multiple archive records in a single batch transaction (OPTIMIZED)
@@ -249,44 +406,49 @@ class ArchiveRepository:
         """
         if not records:
             return True
+        return self.save_archive_records(records) == len(records)
 
+    def checkpoint_wal(self) -> bool:
+        """
+        Copy committed WAL frames back into the database file
+
+        PASSIVE mode never blocks readers or writers; calling it between
+        large batches keeps the -wal file from growing without bound.
+        """
+        try:
+            self._get_connection().execute("PRAGMA wal_checkpoint(PASSIVE)")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to checkpoint WAL: {e}")
+            return False
+
+    def drop_analytical_indexes(self) -> bool:
+        """
+        Drop the secondary archive_records indexes before a bulk backfill
+
+        Each insert then maintains only the article_url index; pair with
+        create_analytical_indexes once the backfill is done.
+        """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
+                for name in self._ANALYTICAL_INDEXES:
+                    conn.execute(f"DROP INDEX IF EXISTS {name}")
+            self.logger.info("Dropped secondary indexes for bulk insert")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to drop indexes: {e}")
+            return False
 
-                # Prepare batch data
-                batch_data = [
-                    (
-                        record.article_url,
-                        record.wayback_url,
-                        record.archive_date,
-                        record.status,
-                        record.http_status,
-                        record.error_message,
-                        record.matched_keywords,
-                        record.checked_wayback,
-                        record.title_search_only,
-                        record.article_title,
-                    )
-                    for record in records
-                ]
-
-                # Execute batch insert
-                cursor.executemany(
-                    """
-                    INSERT OR REPLACE INTO archive_records
-                    (article_url, wayback_url, archive_date, status, http_status,
-                     error_message, matched_keywords, checked_wayback, title_search_only,
-                     article_title, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    """,
-                    batch_data
-                )
-                conn.commit()
-                self.logger.debug(f"Batch saved {len(records)} archive records")
-                return True
+    def create_analytical_indexes(self) -> bool:
+        """Build any missing secondary indexes (one sorted build per index)"""
+        try:
+            with self._get_connection() as conn:
+                for name, definition in self._ANALYTICAL_INDEXES.items():
+                    conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition}")
+            self.logger.info("Secondary indexes created")
+            return True
         except Exception as e:
-            self.logger.error(f"Failed to save batch archive records: {e}")
+            self.logger.error(f"Failed to create indexes: {e}")
             return False
 
     def get_existing_urls(self, urls: List[str]) -> Set[str]:
@@ -305,50 +467,64 @@ class ArchiveRepository:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                placeholders = ",".join("?" * len(urls))
-                query = f"SELECT article_url FROM archive_records WHERE article_url IN ({placeholders})"
-                cursor.execute(query, urls)
+                # Join against a temp table instead of one IN (?, ?, ...) per URL,
+                # which avoids SQLite's bound-parameter limit for large batches
+                cursor.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS url_lookup (url TEXT PRIMARY KEY)"
+                )
+                cursor.execute("DELETE FROM url_lookup")
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO url_lookup (url) VALUES (?)",
+                    ((url,) for url in urls),
+                )
+                cursor.execute(
+                    """
+                    SELECT a.article_url FROM archive_records a
+                    JOIN url_lookup t ON a.article_url = t.url
+                    """
+                )
                 return {row[0] for row in cursor.fetchall()}
         except Exception as e:
             self.logger.error(f"Failed to check existing URLs: {e}")
             return set()
 
-    def get_archive_records_by_date(self, date: str) -> List[ArchiveRecord]:
-        """Get all archive records for a specific date"""
+    def iter_archive_records_by_date(self, date: str) -> Iterator[ArchiveRecord]:
+        """Yield archive records for a specific date without materializing them all"""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT * FROM archive_records 
-                    WHERE archive_date = ? 
-                    ORDER BY id
-                """,
-                    (date,),
-                )
-
-                records = []
-                for row in cursor.fetchall():
-                    records.append(self._row_to_archive_record(row))
-                return records
+            cursor = self._get_connection().execute(
+                """
+                SELECT id, article_url, wayback_url, archive_date, status,
+                       http_status, error_message, matched_keywords,
+                       checked_wayback, title_search_only, article_title
+                FROM archive_records
+                WHERE archive_date = ?
+                ORDER BY id
+            """,
+                (date,),
+            )
+            for row in cursor:
+                yield self._row_to_archive_record(row)
         except Exception as e:
             self.logger.error(f"Failed to get archive records for date {date}: {e}")
-            return []
 
-    def _row_to_archive_record(self, row: tuple) -> ArchiveRecord:
+    def get_archive_records_by_date(self, date: str) -> List[ArchiveRecord]:
+        """Get all archive records for a specific date"""
+        return list(self.iter_archive_records_by_date(date))
+
+    def _row_to_archive_record(self, row: sqlite3.Row) -> ArchiveRecord:
         """Convert database row to ArchiveRecord object"""
         return ArchiveRecord(
-            id=row[0],
-            article_url=row[1],
-            wayback_url=row[2],
-            archive_date=row[3],
-            status=row[4],
-            http_status=row[5],
-            error_message=row[6],
-            matched_keywords=row[8],
-            checked_wayback=bool(row[9]),
-            title_search_only=bool(row[10]),
-            article_title=row[11],
+            id=row["id"],
+            article_url=row["article_url"],
+            wayback_url=row["wayback_url"],
+            archive_date=row["archive_date"],
+            status=row["status"],
+            http_status=row["http_status"],
+            error_message=row["error_message"],
+            matched_keywords=row["matched_keywords"],
+            checked_wayback=bool(row["checked_wayback"]),
+            title_search_only=bool(row["title_search_only"]),
+            article_title=row["article_title"],
         )
 
     # Daily Progress Operations
@@ -389,7 +565,10 @@ class ArchiveRepository:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
-                    SELECT * FROM daily_progress WHERE date = ?
+                    SELECT date, articles_found, articles_archived, articles_failed,
+                           articles_not_found, execution_time, completed_at,
+                           keywords_filtered
+                    FROM daily_progress WHERE date = ?
                 """,
                     (date,),
                 )
@@ -402,17 +581,18 @@ class ArchiveRepository:
             self.logger.error(f"Failed to get daily progress for date {date}: {e}")
             return None
 
-    def _row_to_daily_progress(self, row: tuple) -> DailyProgress:
+    def _row_to_daily_progress(self, row: sqlite3.Row) -> DailyProgress:
         """Convert database row to DailyProgress object"""
+        completed_at = row["completed_at"]
         return DailyProgress(
-            date=row[0],
-            articles_found=row[1],
-            articles_archived=row[2],
-            articles_failed=row[3],
-            articles_not_found=row[4],
-            execution_time=row[5],
-            completed_at=datetime.fromisoformat(row[6]) if row[6] else None,
-            keywords_filtered=row[7],
+            date=row["date"],
+            articles_found=row["articles_found"],
+            articles_archived=row["articles_archived"],
+            articles_failed=row["articles_failed"],
+            articles_not_found=row["articles_not_found"],
+            execution_time=row["execution_time"],
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+            keywords_filtered=row["keywords_filtered"],
         )
 
     # Batch Progress Operations
@@ -457,7 +637,10 @@ class ArchiveRepository:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
-                    SELECT * FROM batch_progress WHERE batch_id = ?
+                    SELECT batch_id, start_date, end_date, status, articles_found,
+                           articles_archived, articles_failed, error_message,
+                           started_at, completed_at, execution_time
+                    FROM batch_progress WHERE batch_id = ?
                 """,
                     (batch_id,),
                 )
@@ -483,20 +666,22 @@ class ArchiveRepository:
             self.logger.error(f"Failed to get completed batches: {e}")
             return set()
 
-    def _row_to_batch_progress(self, row: tuple) -> BatchProgress:
+    def _row_to_batch_progress(self, row: sqlite3.Row) -> BatchProgress:
         """Convert database row to BatchProgress object"""
+        started_at = row["started_at"]
+        completed_at = row["completed_at"]
         return BatchProgress(
-            batch_id=row[0],
-            start_date=row[1],
-            end_date=row[2],
-            status=row[3],
-            articles_found=row[4],
-            articles_archived=row[5],
-            articles_failed=row[6],
-            error_message=row[7],
-            started_at=datetime.fromisoformat(row[8]) if row[8] else None,
-            completed_at=datetime.fromisoformat(row[9]) if row[9] else None,
-            execution_time=row[10],
+            batch_id=row["batch_id"],
+            start_date=row["start_date"],
+            end_date=row["end_date"],
+            status=row["status"],
+            articles_found=row["articles_found"],
+            articles_archived=row["articles_archived"],
+            articles_failed=row["articles_failed"],
+            error_message=row["error_message"],
+            started_at=datetime.fromisoformat(started_at) if started_at else None,
+            completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+            execution_time=row["execution_time"],
         )
 
     # Statistics Operations
@@ -506,11 +691,8 @@ class ArchiveRepository:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT status, COUNT(*) 
-                    FROM archive_records 
-                    GROUP BY status
-                """)
+                # Trigger-maintained counts: a handful of rows, no table scan
+                cursor.execute("SELECT status, n FROM archive_counts WHERE n > 0")
 
                 stats = {}
                 for status, count in cursor.fetchall():
@@ -524,6 +706,14 @@ class ArchiveRepository:
             return {}
 
     def close(self):
-        """Close database connections (cleanup)"""
-        # Note: Using connection-per-operation pattern, no persistent connections to close
-        pass
+        """Close every thread's database connection (cleanup)"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            # Drop all threads' cached handles; later calls reconnect lazily
+            self._thread_local = threading.local()
+
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                self.logger.error(f"Error closing connection: {e}")
@@ -10,12 +10,147 @@ Handles filtering articles by Traditional Chinese keywords:
 - Parallel processing support
 """
 
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
 import unicodedata
 import re
+import sys
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Optional, Callable
+from functools import lru_cache
+from pathlib import Path
+from itertools import islice
+from typing import (
+    Any,
+    AsyncContextManager,
+    List,
+    Dict,
+    Optional,
+    Callable,
+    Iterator,
+    Tuple,
+)
 import logging
 
+try:
+    import hyperscan  # Optional: SIMD multi-literal scanning, preferred when present
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick  # Optional: pyahocorasick, matches all terms in one pass
+except ImportError:
+    ahocorasick = None
+
+# Fetches are I/O bound: ThreadPoolExecutor's own default sizing for I/O work
+DEFAULT_PARALLEL_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Seconds a cached keyword outcome stays valid (pages can change after a "no match")
+DEFAULT_CACHE_TTL = 30 * 24 * 3600
+
+# URLs between progress log lines while filtering
+PROGRESS_LOG_EVERY = 100
+
+# Memory (bytes) of pages kept from the title pass for the content pass
+PAGE_CACHE_BYTES = 32 * 1024 * 1024
+
+# Longest text whose normalized form is memoized (titles, terms, not pages)
+NORMALIZE_CACHE_MAX_LENGTH = 4096
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def _normalize_text(text: str) -> str:
+    """Collapse whitespace and NFC-normalize text"""
+    # Every character \s matches except the ASCII space is non-printable,
+    # so clean text skips the rewrite
+    if "  " in text or not text.isprintable():
+        text = _WHITESPACE_PATTERN.sub(" ", text)
+
+    try:
+        # Normalize to NFC form
+        return unicodedata.normalize("NFC", text)
+    except Exception:
+        return text
+
+
+_normalize_text_cached = lru_cache(maxsize=8192)(_normalize_text)
+
+
+class KeywordResultCache:
+    """
+    On-disk cache of keyword filter outcomes (SQLite)
+
+    Entries are keyed by URL plus a fingerprint of the filter settings, so a
+    change of terms or search mode never reuses stale outcomes. Both matches
+    and "fetched, no match" outcomes are stored; failed fetches are not.
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        """
+        Args:
+            path: SQLite file to store outcomes in
+            ttl: Seconds an entry stays valid (None = forever)
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS keyword_results (
+                    url TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    result TEXT,
+                    stored_at REAL NOT NULL,
+                    PRIMARY KEY (url, fingerprint)
+                )
+            """)
+
+    @staticmethod
+    def fingerprint(terms: List[str], case_sensitive: bool, search_content: bool) -> str:
+        """Stable identifier for the settings an outcome was computed with"""
+        settings = json.dumps([terms, case_sensitive, search_content], ensure_ascii=False)
+        return hashlib.sha1(settings.encode("utf-8")).hexdigest()
+
+    def get(self, url: str, fingerprint: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Look up a stored outcome
+
+        Returns:
+            Tuple of (hit, article data dict or None for a stored non-match)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, stored_at FROM keyword_results WHERE url = ? AND fingerprint = ?",
+                (url, fingerprint),
+            ).fetchone()
+        if row is None or (self.ttl is not None and time.time() - row[1] > self.ttl):
+            return False, None
+        return True, json.loads(row[0]) if row[0] else None
+
+    def put(self, url: str, fingerprint: str, result: Optional[Dict]):
+        """Store an outcome (None records a page that did not match)"""
+        payload = json.dumps(result, ensure_ascii=False) if result else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO keyword_results VALUES (?, ?, ?, ?)",
+                (url, fingerprint, payload, time.time()),
+            )
+
+    def close(self):
+        """Close the cache database"""
+        with self._lock:
+            self._conn.close()
+
 
 class KeywordFilter:
     """
@@ -29,8 +164,18 @@ class KeywordFilter:
     - Thread-safe operations
     """
 
+    # Markup removed before content search: script/style bodies, then any tag
+    _TAG_PATTERN = re.compile(
+        r"<script\b.*?</script\s*>|<style\b.*?</style\s*>|<[^>]+>",
+        re.DOTALL | re.IGNORECASE,
+    )
+
     def __init__(
-        self, fetch_content_func: Callable, extract_title_func: Callable, config: Dict
+        self,
+        fetch_content_func: Callable,
+        extract_title_func: Callable,
+        config: Dict,
+        open_async_fetch: Optional[Callable[[], AsyncContextManager]] = None,
     ):
         """
         Initialize keyword filter
@@ -39,11 +184,38 @@ class KeywordFilter:
             fetch_content_func: Function to fetch HTML content
             extract_title_func: Function to extract title from HTML
             config: Keywords configuration
+            open_async_fetch: Optional factory of an async context manager
+                yielding a coroutine fetch function; when set, the parallel
+                title pass runs on an event loop with it (the session it
+                opens lives for that pass), while sequential passes keep
+                using fetch_content_func
         """
         self.fetch_content = fetch_content_func
+        self.open_async_fetch = open_async_fetch
         self.extract_title = extract_title_func
         self.config = config
         self.logger = logging.getLogger(__name__)
+        # (terms, case_sensitive) -> (prepared terms, scanner, pattern); see _get_matcher
+        self._matchers: Dict[Tuple[Tuple[str, ...], bool], Tuple[List, Any, Any]] = {}
+
+        # Title-pass pages awaiting the content pass with their parsed titles,
+        # newest last (LRU bounded by PAGE_CACHE_BYTES)
+        self._pages: "OrderedDict[str, Tuple[str, bool, str]]" = OrderedDict()
+        self._pages_bytes = 0
+        self._pages_lock = threading.Lock()
+
+        # Optional persistent cache of outcomes, so re-runs skip the network
+        cache_path = config.get("cache_path")
+        self.cache = (
+            KeywordResultCache(cache_path, config.get("cache_ttl"))
+            if cache_path
+            else None
+        )
+
+    def close(self):
+        """Close the result cache, if one is configured"""
+        if self.cache is not None:
+            self.cache.close()
 
     def should_filter_url(self, url: str) -> bool:
         """Check if URL filtering should be applied"""
@@ -63,7 +235,11 @@ class KeywordFilter:
 
     def get_parallel_workers(self) -> int:
         """Get number of parallel workers"""
-        return self.config.get("parallel_workers", 2)
+        return self.config.get("parallel_workers", DEFAULT_PARALLEL_WORKERS)
+
+    def get_async_concurrency(self) -> int:
+        """Get max in-flight requests when fetch_content_func is async"""
+        return self.config.get("async_concurrency", 16)
 
     def should_check_wayback_first(self) -> bool:
         """Check if Wayback should be checked before original site"""
@@ -81,18 +257,29 @@ class KeywordFilter:
         """
         if not text:
             return ""
+        if len(text) > NORMALIZE_CACHE_MAX_LENGTH:
+            # Page bodies are rarely repeated; keep them out of the cache
+            return _normalize_text(text)
+        return _normalize_text_cached(text)
 
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", text)
+    def extract_visible_text(self, html: str) -> str:
+        """
+        Strip markup from HTML so content search only scans readable text
 
-        try:
-            # Normalize to NFC form
-            return unicodedata.normalize("NFC", text)
-        except Exception:
-            return text
+        Args:
+            html: Raw HTML content
+
+        Returns:
+            Text with tags, scripts and styles replaced by spaces
+        """
+        return self._TAG_PATTERN.sub(" ", html)
 
     def check_keywords(
-        self, text: str, terms: List[str], case_sensitive: bool = False
+        self,
+        text: str,
+        terms: List[str],
+        case_sensitive: bool = False,
+        first_only: bool = False,
     ) -> List[str]:
         """
         Check CJKV keywords in text using OR logic
@@ -101,25 +288,143 @@ class KeywordFilter:
             text: Text to search in
             terms: List of terms to search for
             case_sensitive: Whether matching should be case sensitive
+            first_only: Stop at the first matched term (for presence checks)
 
         Returns:
-            List of matched terms
+            List of matched terms (at most one when first_only)
         """
         if not text or not terms:
             return []
 
         text_normalized = self.normalize_cjkv_text(text)
-        text_search = text_normalized if case_sensitive else text_normalized.lower()
+        # casefold only changes Latin/Greek/etc. fragments; CJKV is unaffected
+        text_search = text_normalized if case_sensitive else text_normalized.casefold()
+
+        prepared, scan, pattern = self._get_matcher(terms, case_sensitive)
+        if pattern is not None:
+            # One C-level scan rules out most non-matching texts
+            hit = pattern.search(text_search)
+            if hit is None:
+                return []
+            if first_only:
+                found = hit.group()
+                return [
+                    term for term, term_search in prepared if term_search == found
+                ][:1]
+        if scan is None:
+            # Overlapping terms need their own test; findall would miss them
+            matches = (
+                term for term, term_search in prepared if term_search in text_search
+            )
+            return list(islice(matches, 1)) if first_only else list(matches)
+
+        # An empty term matches any text, as with `in`
+        empty = [term for term, term_search in prepared if not term_search]
+        if first_only and empty:
+            return empty[:1]
+        found = set()
+        for term_search in scan(text_search):
+            found.add(term_search)
+            if first_only:
+                break
+        # Report in configured order
+        return [
+            term
+            for term, term_search in prepared
+            if not term_search or term_search in found
+        ]
+
+    def _get_matcher(
+        self, terms: List[str], case_sensitive: bool
+    ) -> Tuple[List[Tuple[str, str]], Optional[Callable], Optional[re.Pattern]]:
+        """
+        Get the prepared matcher for a term list, building it on first use
+
+        Terms are normalized (and case-folded) once here rather than on every
+        check_keywords call.
+
+        Returns:
+            Tuple of ((term, search form) pairs, multi-pattern scanner or None,
+            compiled alternation of the terms used without a scanner or None).
+            The scanner yields the search forms found in a text; it is backed by
+            hyperscan or pyahocorasick, whichever is installed.
+        """
+        key = (tuple(terms), case_sensitive)
+        matcher = self._matchers.get(key)
+        if matcher is None:
+            prepared = []
+            for term in terms:
+                term_search = self.normalize_cjkv_text(term)
+                if not case_sensitive:
+                    term_search = term_search.casefold()
+                prepared.append((term, term_search))
+
+            searches = list(dict.fromkeys(search for _, search in prepared if search))
+            scan = None
+            if hyperscan is not None and searches:
+                scan = self._build_hyperscan(searches)
+            elif ahocorasick is not None and searches:
+                scan = self._build_automaton(searches)
+
+            pattern = None
+            if scan is None and searches and all(search for _, search in prepared):
+                # Longest first, so a term is never shadowed by its own prefix
+                pattern = re.compile(
+                    "|".join(map(re.escape, sorted(searches, key=len, reverse=True)))
+                )
+
+            matcher = self._matchers[key] = (prepared, scan, pattern)
+        return matcher
+
+    @staticmethod
+    def _build_hyperscan(searches: List[str]) -> Callable[[str], List[str]]:
+        """Compile search forms into a hyperscan database (scratch per thread)"""
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(search).encode("utf-8") for search in searches],
+            ids=list(range(len(searches))),
+            flags=[hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH]
+            * len(searches),
+        )
+        scratches = threading.local()
+
+        def scan(text_search: str) -> List[str]:
+            scratch = getattr(scratches, "scratch", None)
+            if scratch is None:
+                scratch = scratches.scratch = hyperscan.Scratch(database)
+            found: List[str] = []
 
-        matched = []
-        for term in terms:
-            term_normalized = self.normalize_cjkv_text(term)
-            term_search = term_normalized if case_sensitive else term_normalized.lower()
+            def on_match(id, start, end, flags, context):
+                found.append(searches[id])
 
-            if term_search in text_search:
-                matched.append(term)
+            database.scan(
+                text_search.encode("utf-8"), match_event_handler=on_match, scratch=scratch
+            )
+            return found
+
+        return scan
+
+    @staticmethod
+    def _build_automaton(searches: List[str]) -> Callable[[str], Iterator[str]]:
+        """Build a pyahocorasick automaton over the search forms"""
+        automaton = ahocorasick.Automaton()
+        for search in searches:
+            automaton.add_word(search, search)
+        automaton.make_automaton()
+        return lambda text_search: (
+            search for _, search in automaton.iter(text_search)
+        )
 
-        return matched
+    def reload(self, config: Optional[Dict] = None):
+        """
+        Drop prepared matchers, optionally switching to a new keywords config
+
+        Args:
+            config: Replacement keywords configuration
+        """
+        if config is not None:
+            self.config = config
+        self._matchers.clear()
 
     def _process_url_sequential(
         self, url: str, terms: List[str], case_sensitive: bool, search_content: bool
@@ -136,44 +441,59 @@ class KeywordFilter:
         Returns:
             Article data dict if matched, None otherwise
         """
+        fingerprint, hit, cached = self._cache_lookup(
+            url, terms, case_sensitive, search_content
+        )
+        if hit:
+            return cached
+
         try:
-            html, from_wayback = self.fetch_content(url)
-            if not html:
-                return None
+            page = self._take_page(url)
+            if page is not None:
+                # The title pass already parsed this title and it missed
+                html, from_wayback, title = page
+                result = None
+            else:
+                html, from_wayback = self.fetch_content(url)
+                if not html:
+                    return None
+                title = self.extract_title(html)
+                result = self._match_title(
+                    url, title, from_wayback, terms, case_sensitive
+                )
 
-            title = self.extract_title(html)
-            title_matches = self.check_keywords(title, terms, case_sensitive)
-
-            if title_matches:
-                return {
-                    "url": url,
-                    "should_archive": True,
-                    "title": title,
-                    "matched_keywords": title_matches,
-                    "from_wayback": from_wayback,
-                    "title_search_only": True,
-                }
-
-            if search_content:
-                content_matches = self.check_keywords(html, terms, case_sensitive)
+            if result is None and search_content:
+                # Any one term decides archival, so stop at the first hit
+                content_matches = self.check_keywords(
+                    self.extract_visible_text(html),
+                    terms,
+                    case_sensitive,
+                    first_only=True,
+                )
                 if content_matches:
-                    all_matches = list(set(title_matches + content_matches))
-                    return {
+                    result = {
                         "url": url,
                         "should_archive": True,
                         "title": title,
-                        "matched_keywords": all_matches,
+                        "matched_keywords": content_matches,
                         "from_wayback": from_wayback,
                         "title_search_only": False,
                     }
 
+            self._cache_store(url, fingerprint, result)
+            return result
+
         except Exception as e:
             self.logger.debug(f"關鍵詞過濾失敗: {url[:50]} - {str(e)}")
 
         return None
 
     def _process_url_parallel(
-        self, url: str, terms: List[str], case_sensitive: bool
+        self,
+        url: str,
+        terms: List[str],
+        case_sensitive: bool,
+        retain_pages: bool = False,
     ) -> Optional[Dict]:
         """
         Process single URL for keyword matching (parallel, title-only)
@@ -182,33 +502,160 @@ class KeywordFilter:
             url: URL to process
             terms: Keywords to match
             case_sensitive: Case sensitivity setting
+            retain_pages: Keep pages whose title missed for a content pass
 
         Returns:
             Article data dict if matched, None otherwise
         """
+        fingerprint, hit, cached = self._cache_lookup(url, terms, case_sensitive, False)
+        if hit:
+            return cached
+
         try:
             html, from_wayback = self.fetch_content(url)
             if not html:
                 return None
-
             title = self.extract_title(html)
-            title_matches = self.check_keywords(title, terms, case_sensitive)
-
-            if title_matches:
-                return {
-                    "url": url,
-                    "should_archive": True,
-                    "title": title,
-                    "matched_keywords": title_matches,
-                    "from_wayback": from_wayback,
-                    "title_search_only": True,
-                }
-
+            result = self._match_title(url, title, from_wayback, terms, case_sensitive)
+            self._cache_store(url, fingerprint, result)
+            if result is None and retain_pages:
+                self._keep_page(url, html, from_wayback, title)
+            return result
         except Exception as e:
             self.logger.debug(f"Parallel filter failed: {url[:50]} - {str(e)}")
 
         return None
 
+    async def _process_url_async(
+        self,
+        url: str,
+        terms: List[str],
+        case_sensitive: bool,
+        semaphore: asyncio.Semaphore,
+        fetch: Callable,
+        retain_pages: bool = False,
+    ) -> Optional[Dict]:
+        """Title-only keyword matching with an async fetch function"""
+        fingerprint, hit, cached = self._cache_lookup(url, terms, case_sensitive, False)
+        if hit:
+            return cached
+
+        try:
+            async with semaphore:
+                html, from_wayback = await fetch(url)
+            if not html:
+                return None
+            title = self.extract_title(html)
+            result = self._match_title(url, title, from_wayback, terms, case_sensitive)
+            self._cache_store(url, fingerprint, result)
+            if result is None and retain_pages:
+                self._keep_page(url, html, from_wayback, title)
+            return result
+        except Exception as e:
+            self.logger.debug(f"Async filter failed: {url[:50]} - {str(e)}")
+
+        return None
+
+    def _iter_urls_async(
+        self,
+        urls: List[str],
+        terms: List[str],
+        case_sensitive: bool,
+        retain_pages: bool = False,
+    ) -> Iterator[Optional[Dict]]:
+        """Fetch and title-match URLs concurrently on one event loop, yielding as done"""
+        loop = asyncio.new_event_loop()
+        pending = set()
+        session = None
+        try:
+            fetch = self.fetch_content
+            if self.open_async_fetch is not None:
+                session = self.open_async_fetch()
+                fetch = loop.run_until_complete(session.__aenter__())
+            semaphore = asyncio.Semaphore(self.get_async_concurrency())
+            pending = {
+                loop.create_task(
+                    self._process_url_async(
+                        url, terms, case_sensitive, semaphore, fetch, retain_pages
+                    )
+                )
+                for url in urls
+            }
+            while pending:
+                done, pending = loop.run_until_complete(
+                    asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # Consumer stopped early or failed: don't leave fetches running
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
+            if session is not None:
+                loop.run_until_complete(session.__aexit__(None, None, None))
+            loop.close()
+
+    def _cache_lookup(
+        self, url: str, terms: List[str], case_sensitive: bool, search_content: bool
+    ) -> Tuple[Optional[str], bool, Optional[Dict]]:
+        """Return (fingerprint, hit, cached outcome); fingerprint is None without a cache"""
+        if self.cache is None:
+            return None, False, None
+        fingerprint = self.cache.fingerprint(terms, case_sensitive, search_content)
+        hit, cached = self.cache.get(url, fingerprint)
+        return fingerprint, hit, cached
+
+    def _cache_store(self, url: str, fingerprint: Optional[str], result: Optional[Dict]):
+        """Persist an outcome for a successfully fetched page"""
+        if fingerprint is not None:
+            self.cache.put(url, fingerprint, result)
+
+    def _keep_page(self, url: str, html: str, from_wayback: bool, title: str):
+        """Hold a fetched page for the content pass, evicting the oldest"""
+        with self._pages_lock:
+            old = self._pages.pop(url, None)
+            if old is not None:
+                self._pages_bytes -= sys.getsizeof(old[0])
+            self._pages[url] = (html, from_wayback, title)
+            self._pages_bytes += sys.getsizeof(html)
+            while self._pages_bytes > PAGE_CACHE_BYTES:
+                _, (evicted, _, _) = self._pages.popitem(last=False)
+                self._pages_bytes -= sys.getsizeof(evicted)
+
+    def _take_page(self, url: str) -> Optional[Tuple[str, bool, str]]:
+        """Remove and return a page kept by the title pass, if still held"""
+        with self._pages_lock:
+            page = self._pages.pop(url, None)
+            if page is not None:
+                self._pages_bytes -= sys.getsizeof(page[0])
+            return page
+
+    def _match_title(
+        self,
+        url: str,
+        title: str,
+        from_wayback: bool,
+        terms: List[str],
+        case_sensitive: bool,
+    ) -> Optional[Dict]:
+        """Build the article data dict if the page title matches any keyword"""
+        title_matches = self.check_keywords(title, terms, case_sensitive)
+
+        if title_matches:
+            return {
+                "url": url,
+                "should_archive": True,
+                "title": title,
+                "matched_keywords": title_matches,
+                "from_wayback": from_wayback,
+                "title_search_only": True,
+            }
+        return None
+
     def filter_urls_sequential(self, urls: List[str]) -> List[Dict]:
         """
         Sequential keyword filtering with optional content search
@@ -219,6 +666,18 @@ class KeywordFilter:
         Returns:
             List of matching article data
         """
+        return list(self.iter_filter_urls_sequential(urls))
+
+    def iter_filter_urls_sequential(self, urls: List[str]) -> Iterator[Dict]:
+        """
+        Sequential keyword filtering, yielding each match as soon as it is found
+
+        Args:
+            urls: List of URLs to filter
+
+        Yields:
+            Matching article data
+        """
         terms = self.get_keywords()
         case_sensitive = self.is_case_sensitive()
         search_content = self.should_search_content()
@@ -227,7 +686,7 @@ class KeywordFilter:
             f"開始關鍵詞過濾: {len(terms)} 個關鍵詞, 搜尋內容: {search_content}"
         )
 
-        matching_articles = []
+        found = 0
         total = len(urls)
 
         for i, url in enumerate(urls):
@@ -235,29 +694,46 @@ class KeywordFilter:
                 url, terms, case_sensitive, search_content
             )
             if result:
-                matching_articles.append(result)
-
-            if i % 20 == 0:
-                self.logger.info(
-                    f"進度: {i}/{total}, 找到: {len(matching_articles)} 篇匹配"
-                )
+                found += 1
+                yield result
 
-        percentage = (len(matching_articles) / total * 100) if total > 0 else 0
-        self.logger.info(
-            f"關鍵詞過濾完成: {len(matching_articles)}/{total} 篇匹配 ({percentage:.1f}%)"
-        )
+            if i % PROGRESS_LOG_EVERY == 0 and self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("進度: %d/%d, 找到: %d 篇匹配", i, total, found)
 
-        return matching_articles
+        self._log_filter_complete(found, total)
 
-    def filter_urls_parallel(self, urls: List[str]) -> List[Dict]:
+    def filter_urls_parallel(
+        self, urls: List[str], retain_pages: bool = False
+    ) -> List[Dict]:
         """
         Parallel keyword filtering (title-only for performance)
 
+        Uses a thread pool, or a single asyncio event loop when
+        open_async_fetch is set or fetch_content_func is a coroutine function
+        (must not be called from inside a running event loop in that case).
+
         Args:
             urls: List of URLs to filter
+            retain_pages: Keep recently fetched non-matching pages so a
+                following sequential content pass need not fetch them again
 
         Returns:
-            List of matching article data
+            List of matching article data, in completion order
+        """
+        return list(self.iter_filter_urls_parallel(urls, retain_pages))
+
+    def iter_filter_urls_parallel(
+        self, urls: List[str], retain_pages: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Parallel title-only keyword filtering, yielding matches as fetches complete
+
+        Args:
+            urls: List of URLs to filter
+            retain_pages: See filter_urls_parallel
+
+        Yields:
+            Matching article data
         """
         terms = self.get_keywords()
         case_sensitive = self.is_case_sensitive()
@@ -267,35 +743,63 @@ class KeywordFilter:
             f"開始關鍵詞過濾 (並行 {workers} workers): {len(terms)} 個關鍵詞"
         )
 
-        matching_articles = []
+        if self.open_async_fetch is not None or inspect.iscoroutinefunction(
+            self.fetch_content
+        ):
+            # Async fetcher: many requests in flight on one thread, no pool
+            results = self._iter_urls_async(urls, terms, case_sensitive, retain_pages)
+        else:
+            results = self._iter_urls_threaded(
+                urls, terms, case_sensitive, workers, retain_pages
+            )
+
+        found = 0
         total = len(urls)
 
+        for completed, result in enumerate(results, 1):
+            if result:
+                found += 1
+                yield result
+
+            if completed % PROGRESS_LOG_EVERY == 0 and self.logger.isEnabledFor(
+                logging.INFO
+            ):
+                self.logger.info("進度: %d/%d, 找到: %d 篇匹配", completed, total, found)
+
+        self._log_filter_complete(found, total)
+
+    def _iter_urls_threaded(
+        self,
+        urls: List[str],
+        terms: List[str],
+        case_sensitive: bool,
+        workers: int,
+        retain_pages: bool = False,
+    ) -> Iterator[Optional[Dict]]:
+        """Title-only keyword matching with a thread pool of blocking fetches"""
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {
+            futures = [
                 executor.submit(
-                    self._process_url_parallel, url, terms, case_sensitive
-                ): url
+                    self._process_url_parallel,
+                    url,
+                    terms,
+                    case_sensitive,
+                    retain_pages,
+                )
                 for url in urls
-            }
-            completed = 0
-
-            for future in as_completed(futures):
-                completed += 1
-                result = future.result()
-                if result:
-                    matching_articles.append(result)
-
-                if completed % 20 == 0:
-                    self.logger.info(
-                        f"進度: {completed}/{total}, 找到: {len(matching_articles)} 篇匹配"
-                    )
-
-        percentage = (len(matching_articles) / total * 100) if total > 0 else 0
-        self.logger.info(
-            f"關鍵詞過濾完成: {len(matching_articles)}/{total} 篇匹配 ({percentage:.1f}%)"
-        )
-
-        return matching_articles
+            ]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                # Consumer stopped early: drop fetches that have not started
+                for future in futures:
+                    future.cancel()
+
+    def _log_filter_complete(self, found: int, total: int):
+        """Log the final match count of a filtering pass"""
+        percentage = (found / total * 100) if total > 0 else 0
+        self.logger.info(f"關鍵詞過濾完成: {found}/{total} 篇匹配 ({percentage:.1f}%)")
 
     def filter_urls(self, urls: List[str]) -> List[Dict]:
         """
@@ -307,19 +811,48 @@ class KeywordFilter:
         Returns:
             List of matching article data
         """
+        return list(self.iter_filter_urls(urls))
+
+    def iter_filter_urls(self, urls: List[str]) -> Iterator[Dict]:
+        """
+        Filter URLs by keywords, yielding each article as soon as it qualifies
+
+        Lets callers start archiving the first matches while later URLs are
+        still being fetched.
+
+        Args:
+            urls: List of URLs to filter
+
+        Yields:
+            Matching article data
+        """
         if not self.should_filter_url(urls[0] if urls else ""):
-            return [{"url": url, "should_archive": True} for url in urls]
+            yield from ({"url": url, "should_archive": True} for url in urls)
+            return
 
         terms = self.get_keywords()
         if not terms:
             self.logger.warning("關鍵詞列表為空，跳過過濾")
-            return [{"url": url, "should_archive": True} for url in urls]
+            yield from ({"url": url, "should_archive": True} for url in urls)
+            return
 
         search_content = self.should_search_content()
 
         # Use parallel processing for title-only filtering
         if not search_content:
-            return self.filter_urls_parallel(urls)
-        else:
-            # Use sequential processing for content search (due to rate limiting)
-            return self.filter_urls_sequential(urls)
+            yield from self.iter_filter_urls_parallel(urls)
+            return
+
+        # Titles first in parallel; only the misses go through the sequential
+        # content search (due to rate limiting), reusing the pages just fetched
+        matched_urls = set()
+        try:
+            for article in self.iter_filter_urls_parallel(urls, retain_pages=True):
+                matched_urls.add(article["url"])
+                yield article
+            remaining = [url for url in urls if url not in matched_urls]
+            yield from self.iter_filter_urls_sequential(remaining)
+        finally:
+            with self._pages_lock:
+                self._pages.clear()
+                self._pages_bytes = 0
@@ -17,24 +17,36 @@ Benefits of refactoring:
 - More modular and extensible design
 """
 
+import asyncio
+import json
 import time
-import argparse
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager
 import requests
+from requests.adapters import HTTPAdapter
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Any, Callable, List, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
 import logging
 import sys
 
+try:
+    import aiohttp  # Optional: event-loop fetches for the keyword title pass
+except ImportError:
+    aiohttp = None
+
 # Import specialized components
 from url_generator import URLGenerator
-from wayback_archiver import WaybackArchiver
-from keyword_filter import KeywordFilter
+from wayback_archiver import ArchiveResult, WaybackArchiver
+from keyword_filter import DEFAULT_CACHE_TTL, DEFAULT_PARALLEL_WORKERS, KeywordFilter
 from database_repository import (
-    ArchiveRepository,
+    SAVE_BATCH_SIZE,
     ArchiveRecord,
+    ArchiveRepository,
     DailyProgress,
 )
 
@@ -42,26 +54,42 @@ from database_repository import (
 class RateLimiter:
     """Pre-request rate limiting with token bucket algorithm"""
 
-    def __init__(self, delay: float, max_burst: int = 3):
-        self.delay = delay
-        self.tokens = max_burst
-        self.max_tokens = max_burst
-        self.last_request = time.time()
+    def __init__(self, rate_per_sec: float, capacity: int = 3):
+        """
+        Args:
+            rate_per_sec: Tokens added per second (1 / seconds between requests)
+            capacity: Maximum burst of requests allowed without waiting
+        """
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self.tokens = capacity
+        # Monotonic: wall-clock jumps (NTP) must not stall or unthrottle requests
+        self._last_ns = time.monotonic_ns()
         self.lock = threading.Lock()
 
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it"""
+        # Tokens may go negative: requests already queued. Callers sleep off
+        # the debt without holding the lock
+        with self.lock:
+            now = time.monotonic_ns()
+            refill = (now - self._last_ns) * self.rate_per_sec / 1e9
+            self.tokens = min(self.capacity, self.tokens + refill)
+            self.tokens -= 1
+            self._last_ns = now
+            return -self.tokens / self.rate_per_sec
+
     def acquire(self):
         """Wait if needed before making request"""
-        with self.lock:
-            now = time.time()
-            elapsed = now - self.last_request
-            self.tokens = min(self.max_tokens, self.tokens + elapsed / self.delay)
-            if self.tokens < 1:
-                wait_time = (1 - self.tokens) * self.delay
-                time.sleep(wait_time)
-                self.tokens = 0
-            else:
-                self.tokens -= 1
-            self.last_request = time.time()
+        wait_time = self._reserve()
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def acquire_async(self):
+        """Like acquire, but yields to the event loop instead of blocking it"""
+        wait_time = self._reserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
 
 
 class MingPaoArchiver:
@@ -76,6 +104,9 @@ class MingPaoArchiver:
     """
 
     BASE_URL = "http://www.mingpaocanada.com/tor"
+    USER_AGENT = (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+    )
 
     # Pre-compiled regex patterns for title extraction (OPTIMIZATION)
     ARTICLE_TITLE_PATTERN = re.compile(
@@ -92,18 +123,59 @@ class MingPaoArchiver:
     )
     HTML_TAG_CLEANUP_PATTERN = re.compile(r"<[^>]+>")
     WHITESPACE_CLEANUP_PATTERN = re.compile(r"[\s\n\r\t]+")
+    CJK_PATTERN = re.compile(r"[\u4e00-\u9fff]")
+
+    # Byte twins of the title patterns: raw pages are searched undecoded and
+    # only the captured title is decoded
+    ARTICLE_TITLE_BYTES_PATTERN = re.compile(
+        ARTICLE_TITLE_PATTERN.pattern.encode(), re.IGNORECASE | re.DOTALL
+    )
+    OG_TITLE_BYTES_PATTERN = re.compile(OG_TITLE_PATTERN.pattern.encode(), re.IGNORECASE)
+    TITLE_TAG_BYTES_PATTERN = re.compile(
+        TITLE_TAG_PATTERN.pattern.encode(), re.IGNORECASE
+    )
+
+    # Ming Pao pages are Big5; Wayback copies may be re-encoded as UTF-8
+    PAGE_ENCODINGS = ("big5-hkscs", "big5", "utf-8", "latin-1")
+
+    # Connect timeout for page fetches: dead hosts fail fast while the read
+    # timeout still allows slow bodies
+    CONNECT_TIMEOUT = 3
 
     def __init__(self, config_path: str = "config.json"):
         """Initialize the archiver with all components"""
+        self.missing_config_path = None
         self.config = self.load_config(config_path)
         self.setup_logging()
+        if self.missing_config_path:
+            self.logger.warning(f"配置文件 {config_path} 不存在，使用默認配置")
 
         # Initialize repository first
         self.repository = ArchiveRepository(self.config["database"]["path"])
 
         # Initialize rate limiter
         rate_limit_delay = self.config["archiving"]["rate_limit_delay"]
-        self.rate_limiter = RateLimiter(delay=rate_limit_delay, max_burst=1)
+        self.rate_limiter = RateLimiter(rate_per_sec=1.0 / rate_limit_delay, capacity=1)
+
+        # Per-host in-flight request caps, so a slow archive.org does not
+        # starve mingpao.com fetches (or the reverse)
+        self.max_concurrent_per_host = self.config["archiving"][
+            "max_concurrent_per_host"
+        ]
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+
+        # Snapshot lookups, shared by the keyword and title passes
+        self._wayback_probe = lru_cache(maxsize=4096)(self._probe_wayback)
+
+        # Shared session: keep-alive connections instead of a new TCP/TLS
+        # handshake per request to mingpaocanada.com and web.archive.org
+        self.session = self._create_session()
+        self._dispatch = {
+            "GET": self.session.get,
+            "POST": self.session.post,
+            "HEAD": self.session.head,
+        }
 
         # Initialize statistics first
         self.stats = {
@@ -127,11 +199,21 @@ class MingPaoArchiver:
             stats_dict=self.stats,
             stats_lock=self.stats_lock,
         )
+        keywords_config = self.config.get("keywords", {})
+        open_async_fetch = None
+        if keywords_config.get("async_fetch", False):
+            if aiohttp is not None:
+                open_async_fetch = self.open_async_fetch
+            else:
+                self.logger.warning("keywords.async_fetch 需要 aiohttp，改用執行緒池")
         self.keyword_filter = KeywordFilter(
             fetch_content_func=self.fetch_html_content,
             extract_title_func=self.extract_title_from_html,
-            config=self.config.get("keywords", {}),
+            config=keywords_config,
+            open_async_fetch=open_async_fetch,
         )
+        # Read once; every page fetch consults it
+        self._wayback_first = self.keyword_filter.should_check_wayback_first()
 
         # Setup directories
         self.setup_directories()
@@ -142,19 +224,44 @@ class MingPaoArchiver:
         self.logger.info("=" * 60)
 
     def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Rate-limited HTTP request wrapper"""
-        self.rate_limiter.acquire()
-
-        method_upper = method.upper()
-        if method_upper == "GET":
-            return requests.get(url, **kwargs)
-        elif method_upper == "POST":
-            return requests.post(url, **kwargs)
-        elif method_upper == "HEAD":
-            return requests.head(url, **kwargs)
-        else:
+        """Rate-limited HTTP request wrapper, bounded per host"""
+        send = self._dispatch.get(method) or self._dispatch.get(method.upper())
+        if send is None:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
+        with self._host_slot(urlsplit(url).netloc):
+            self.rate_limiter.acquire()
+            return send(url, **kwargs)
+
+    def _create_session(self) -> requests.Session:
+        """Create the pooled HTTP session used for all requests"""
+        session = requests.Session()
+        # Enough pooled connections per host for every concurrent worker
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(
+                16,
+                self.max_concurrent_per_host,
+                self.config["keywords"]["parallel_workers"],
+                self.config["parallel"]["max_workers"],
+            ),
+            max_retries=0,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = self.USER_AGENT
+        return session
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent requests to host"""
+        slot = self._host_slots.get(host)
+        if slot is None:
+            with self._host_slots_lock:
+                slot = self._host_slots.setdefault(
+                    host, threading.BoundedSemaphore(self.max_concurrent_per_host)
+                )
+        return slot
+
     def load_config(self, config_path: str) -> Dict:
         """Load and merge configuration"""
         default_config = {
@@ -166,6 +273,8 @@ class MingPaoArchiver:
                 "timeout": 30,
                 "max_retries": 3,
                 "retry_delay": 10,
+                "max_concurrent_per_host": 4,
+                "title_fetch_bytes": 65536,
             },
             "daily_limit": 2000,
             "date_range": {"start": "2025-01-01", "end": "2025-01-31"},
@@ -191,30 +300,35 @@ class MingPaoArchiver:
                 "normalization": "NFC",
                 "logic": "or",
                 "search_content": False,
-                "parallel_workers": 2,
+                "parallel_workers": DEFAULT_PARALLEL_WORKERS,
                 "wayback_first": True,
+                "wayback_probe": False,
+                "async_fetch": False,
+                "cache_path": None,
+                "cache_ttl": DEFAULT_CACHE_TTL,
             },
         }
 
         try:
-            import json
-
             with open(config_path, "r", encoding="utf-8") as f:
                 user_config = json.load(f)
                 self.merge_config(default_config, user_config)
                 return default_config
         except FileNotFoundError:
-            self.logger = logging.getLogger(__name__)
-            self.logger.warning(f"配置文件 {config_path} 不存在，使用默認配置")
+            # Logging is not set up yet; __init__ reports this afterwards
+            self.missing_config_path = config_path
             return default_config
 
     def merge_config(self, default: Dict, user: Dict):
-        """Recursively merge user config into default"""
-        for key, value in user.items():
-            if key in default and isinstance(default[key], dict):
-                self.merge_config(default[key], value)
-            else:
-                default[key] = value
+        """Deep-merge user config into default, in place"""
+        pending = [(default, user)]
+        while pending:
+            target, source = pending.pop()
+            for key, value in source.items():
+                if isinstance(value, dict) and isinstance(target.get(key), dict):
+                    pending.append((target[key], value))
+                else:
+                    target[key] = value
 
     def setup_logging(self):
         """Setup logging system"""
@@ -240,41 +354,98 @@ class MingPaoArchiver:
 
     def _decode_response(self, response) -> str:
         """Decode response content with Big5 fallback for Ming Pao"""
+        text = self._decode_bytes(response.content)
+        if text is None:
+            # Fallback to requests' auto-detection
+            return response.text
+        return text
+
+    def _decode_bytes(self, content: bytes) -> Optional[str]:
+        """Decode with the first page encoding that yields Chinese text, if any"""
         # Try Big5 first for Ming Pao (they use Big5 encoding)
-        encodings = ["big5-hkscs", "big5", "utf-8", "latin-1"]
-
-        for encoding in encodings:
+        for encoding in self.PAGE_ENCODINGS:
             try:
-                text = response.content.decode(encoding)
+                text = content.decode(encoding)
                 # Verify it contains valid Chinese characters
-                if any("\u4e00" <= c <= "\u9fff" for c in text):
+                if self.CJK_PATTERN.search(text):
                     return text
             except (UnicodeDecodeError, LookupError):
                 continue
-
-        # Fallback to requests' auto-detection
-        return response.text
+        return None
 
     def fetch_html_content(self, url: str, timeout: int = 15) -> Tuple[str, bool]:
         """Fetch HTML content with Wayback fallback"""
-        try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
-
-            wayback_first = self.keyword_filter.should_check_wayback_first()
+        text, from_wayback = self._fetch_page(url, timeout, self._decode_response)
+        return text or "", from_wayback
+
+    def fetch_html_head(
+        self, url: str, timeout: int = 15, max_bytes: Optional[int] = None
+    ) -> Tuple[bytes, bool]:
+        """
+        Fetch only the start of a page, undecoded, with Wayback fallback
+
+        Titles sit near the top, so reading archiving.title_fetch_bytes
+        (0 = whole page) avoids pulling megabyte Wayback pages; pass the
+        result to extract_title_from_html, which decodes just the title.
+        """
+        if max_bytes is None:
+            max_bytes = self.config["archiving"]["title_fetch_bytes"]
+        if not max_bytes:
+            content, from_wayback = self._fetch_page(
+                url, timeout, lambda response: response.content
+            )
+            return content or b"", from_wayback
 
+        def read_head(response) -> bytes:
+            try:
+                return response.raw.read(max_bytes, decode_content=True)
+            finally:
+                # Drops the connection rather than draining the rest of the body
+                response.close()
+
+        content, from_wayback = self._fetch_page(url, timeout, read_head, stream=True)
+        return content or b"", from_wayback
+
+    def _fetch_page(
+        self, url: str, timeout: int, read: Callable, stream: bool = False
+    ) -> Tuple[Any, bool]:
+        """
+        Fetch a page from Wayback or the original site
+
+        Args:
+            url: Article URL
+            timeout: Base timeout in seconds
+            read: Turns a 200 response into page content
+            stream: Defer the body download to read
+
+        Returns:
+            Tuple of (content or None, whether it came from Wayback)
+        """
+        try:
             # Check Wayback first
-            if wayback_first:
+            wayback_url = None
+            if self._wayback_first:
                 wayback_url = f"https://web.archive.org/web/2/{url}"
+                if self.config["keywords"].get("wayback_probe", False):
+                    try:
+                        # Only GET a snapshot the availability API knows about
+                        wayback_url = self._wayback_probe(url)
+                    except Exception as e:
+                        self.logger.debug(f"Wayback probe failed: {url[:50]} - {str(e)}")
+
+            if wayback_url:
                 try:
                     response = self._make_request(
-                        "GET", wayback_url, timeout=timeout * 2, headers=headers
+                        "GET",
+                        wayback_url,
+                        timeout=(self.CONNECT_TIMEOUT, timeout * 2),
+                        stream=stream,
                     )
                     if response.status_code == 200:
-                        text = self._decode_response(response)
-                        if text.strip():
-                            return text, True
+                        content = read(response)
+                        if content.strip():
+                            return content, True
+                    response.close()
                 except Exception as e:
                     self.logger.debug(f"Wayback check failed: {url[:50]} - {str(e)}")
 
@@ -284,13 +455,17 @@ class MingPaoArchiver:
                     response = self._make_request(
                         "GET",
                         url,
-                        timeout=timeout / 2 if attempt == 0 else timeout,
-                        headers=headers,
+                        timeout=(
+                            self.CONNECT_TIMEOUT,
+                            timeout / 2 if attempt == 0 else timeout,
+                        ),
+                        stream=stream,
                     )
                     if response.status_code == 200:
-                        text = self._decode_response(response)
-                        if text.strip():
-                            return text, False
+                        content = read(response)
+                        if content.strip():
+                            return content, False
+                    response.close()
                 except requests.exceptions.ConnectionError as e:
                     if "Connection reset by peer" in str(e) and attempt == 0:
                         self.logger.debug(
@@ -306,35 +481,136 @@ class MingPaoArchiver:
         except Exception as e:
             self.logger.debug(f"Fetch failed: {url[:50]} - {str(e)}")
 
+        return None, False
+
+    @asynccontextmanager
+    async def open_async_fetch(self):
+        """
+        Open a pooled aiohttp session for one keyword title pass
+
+        Yields an async fetch(url) with fetch_html_content's semantics.
+        Per-host concurrency is capped by the connector instead of the
+        threading semaphores, and the shared RateLimiter still paces requests.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.config["keywords"].get("async_concurrency", 16),
+            limit_per_host=self.config["archiving"]["max_concurrent_per_host"],
+        )
+        async with aiohttp.ClientSession(
+            connector=connector, headers={"User-Agent": self.USER_AGENT}
+        ) as session:
+
+            async def fetch(url: str) -> Tuple[str, bool]:
+                return await self._fetch_page_async(session, url)
+
+            yield fetch
+
+    async def _fetch_page_async(
+        self, session, url: str, timeout: int = 15
+    ) -> Tuple[str, bool]:
+        """Async twin of fetch_html_content: Wayback first, then the origin twice"""
+        attempts = []
+        if self._wayback_first:
+            wayback_url = f"https://web.archive.org/web/2/{url}"
+            if self.config["keywords"].get("wayback_probe", False):
+                try:
+                    # Cached lookup shared with the threaded path
+                    wayback_url = await asyncio.to_thread(self._wayback_probe, url)
+                except Exception as e:
+                    self.logger.debug(f"Wayback probe failed: {url[:50]} - {str(e)}")
+            if wayback_url:
+                attempts.append((wayback_url, timeout * 2, True))
+        attempts += [(url, timeout / 2, False), (url, timeout, False)]
+
+        for target, read_timeout, from_wayback in attempts:
+            try:
+                await self.rate_limiter.acquire_async()
+                async with session.get(
+                    target,
+                    timeout=aiohttp.ClientTimeout(
+                        sock_connect=self.CONNECT_TIMEOUT, sock_read=read_timeout
+                    ),
+                ) as response:
+                    if response.status != 200:
+                        continue
+                    content = await response.read()
+                text = self._decode_bytes(content)
+                if text is None:
+                    text = content.decode("utf-8", errors="replace")
+                if text.strip():
+                    return text, from_wayback
+            except Exception as e:
+                self.logger.debug(f"Async fetch failed: {target[:50]} - {str(e)}")
+
         return "", False
 
-    def extract_title_from_html(self, html: str) -> str:
-        """Extract title from HTML with optimized pre-compiled regex patterns (OPTIMIZED)"""
+    def _probe_wayback(self, url: str) -> Optional[str]:
+        """
+        Look up the closest Wayback snapshot via the availability API
+
+        A ~200 byte JSON reply, instead of a full snapshot GET that only
+        fails after the timeout when nothing was archived. Wrapped in a
+        per-instance LRU as _wayback_probe; errors raise and are not cached.
+
+        Returns:
+            Snapshot URL, or None if the URL has no usable snapshot
+        """
+        response = self._make_request(
+            "GET",
+            "https://archive.org/wayback/available",
+            params={"url": url},
+            timeout=(self.CONNECT_TIMEOUT, 5),
+        )
+        response.raise_for_status()
+        closest = response.json().get("archived_snapshots", {}).get("closest") or {}
+        if not closest.get("available") or closest.get("status") != "200":
+            return None
+        # Stay on the pooled HTTPS connection
+        return closest["url"].replace("http://", "https://", 1)
+
+    def extract_title_from_html(self, html: Union[str, bytes]) -> str:
+        """
+        Extract title from HTML with pre-compiled regex patterns
+
+        Accepts decoded text or raw page bytes; for bytes only the matched
+        title is decoded (Big5 first, as for whole pages).
+        """
         if not html:
             return ""
 
+        if isinstance(html, bytes):
+            article_pattern = self.ARTICLE_TITLE_BYTES_PATTERN
+            og_pattern = self.OG_TITLE_BYTES_PATTERN
+            title_pattern = self.TITLE_TAG_BYTES_PATTERN
+            decode = self._decode_title_bytes
+        else:
+            article_pattern = self.ARTICLE_TITLE_PATTERN
+            og_pattern = self.OG_TITLE_PATTERN
+            title_pattern = self.TITLE_TAG_PATTERN
+            decode = str
+
         try:
-            # Try article-title h3 first (Ming Pao specific) - pre-compiled pattern (OPTIMIZATION)
-            article_title_match = self.ARTICLE_TITLE_PATTERN.search(html)
+            # Try article-title h3 first (Ming Pao specific)
+            article_title_match = article_pattern.search(html)
             if article_title_match:
-                title = article_title_match.group(1)
+                title = decode(article_title_match.group(1))
                 title = self.HTML_TAG_CLEANUP_PATTERN.sub("", title)  # Remove any inner HTML tags
                 title = self.WHITESPACE_CLEANUP_PATTERN.sub(" ", title).strip()  # Normalize whitespace
                 if title and len(title) > 5:  # Ensure we have actual content
                     return self.keyword_filter.normalize_cjkv_text(title)
 
-            # Try og:title - pre-compiled pattern (OPTIMIZATION)
-            og_title_match = self.OG_TITLE_PATTERN.search(html)
+            # Try og:title
+            og_title_match = og_pattern.search(html)
             if og_title_match:
-                title = og_title_match.group(1)
+                title = decode(og_title_match.group(1))
                 # Skip generic site title
                 if "明報新聞網" not in title or len(title) > 50:
                     return self.keyword_filter.normalize_cjkv_text(title.strip())
 
-            # Fallback to <title> tag - pre-compiled pattern (OPTIMIZATION)
-            title_match = self.TITLE_TAG_PATTERN.search(html)
+            # Fallback to <title> tag
+            title_match = title_pattern.search(html)
             if title_match:
-                title = title_match.group(1)
+                title = decode(title_match.group(1))
                 title = self.WHITESPACE_CLEANUP_PATTERN.sub(" ", title).strip()
                 # Skip generic site title
                 if "明報新聞網" not in title or len(title) > 50:
@@ -345,14 +621,16 @@ class MingPaoArchiver:
 
         return ""
 
+    def _decode_title_bytes(self, title: bytes) -> str:
+        """Decode a title cut from raw page bytes"""
+        text = self._decode_bytes(title)
+        return text if text is not None else title.decode("utf-8", errors="replace")
+
     def check_url_exists(self, url: str) -> bool:
         """Check if URL exists (legacy method for compatibility)"""
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
             response = self._make_request(
-                "HEAD", url, timeout=10, allow_redirects=True, headers=headers
+                "HEAD", url, timeout=(self.CONNECT_TIMEOUT, 10), allow_redirects=True
             )
             return response.status_code == 200
         except Exception as e:
@@ -361,8 +639,13 @@ class MingPaoArchiver:
 
     def _get_urls_to_process(
         self, target_date: datetime, archive_mode: str = "all"
-    ) -> List[Dict]:
-        """Get URLs to process with filtering applied"""
+    ) -> Tuple[List[Dict], int]:
+        """
+        Get URLs to process with filtering applied
+
+        Returns:
+            Tuple of (articles to process, number of URLs generated)
+        """
 
         # Generate URLs using URL generator
         article_urls = self.url_generator.generate_article_urls(target_date)
@@ -373,17 +656,17 @@ class MingPaoArchiver:
 
         if not article_urls:
             self.logger.warning("沒有生成任何 URL")
-            return []
+            return [], 0
 
-        # Check existing URLs in database
+        # Check existing URLs in database (a set: O(1) membership tests)
         existing_urls = self.repository.get_existing_urls(article_urls)
+        new_urls = [url for url in article_urls if url not in existing_urls]
 
         if archive_mode == "keywords":
-            # Apply keyword filtering
-            matching_articles = self.keyword_filter.filter_urls(article_urls)
-            articles_to_process = [
-                a for a in matching_articles if a["url"] not in existing_urls
-            ]
+            # Apply keyword filtering, skipping pages already archived so
+            # they are not fetched just to be discarded
+            matching_articles = self.keyword_filter.filter_urls(new_urls)
+            articles_to_process = matching_articles
 
             if matching_articles:
                 self.logger.info(
@@ -394,9 +677,7 @@ class MingPaoArchiver:
                 articles_to_process = []
         else:
             # Process all URLs
-            articles_to_process = [
-                {"url": url} for url in article_urls if url not in existing_urls
-            ]
+            articles_to_process = [{"url": url} for url in new_urls]
             self.logger.info(
                 f"待處理: {len(articles_to_process)} 個新 URL ({len(existing_urls)} 個已存在)"
             )
@@ -404,21 +685,22 @@ class MingPaoArchiver:
             # Verify URLs if configured
             if self.config["archiving"]["verify_first"]:
                 articles_to_process = [
-                    {"url": url}
-                    for url in articles_to_process
-                    if self.check_url_exists(url["url"])
+                    a for a in articles_to_process if self.check_url_exists(a["url"])
                 ]
 
-        return articles_to_process
+        return articles_to_process, len(article_urls)
 
     def archive_date(self, target_date: datetime, mode: str = "all") -> Dict:
         """Archive articles for a single date"""
-        date_str = target_date.strftime("%Y%m%d")
+        # Format the date once; date_str keys every record for this day
+        year, month, day = target_date.year, target_date.month, target_date.day
+        date_str = f"{year:04d}{month:02d}{day:02d}"
+        iso_date = f"{year:04d}-{month:02d}-{day:02d}"
         title_mode = f"{'關鍵詞' if mode == 'keywords' else ''}過濾"
 
         self.logger.info("=" * 60)
         self.logger.info(
-            f"開始處理 ({title_mode}): {date_str} ({target_date.strftime('%Y-%m-%d %A')})"
+            f"開始處理 ({title_mode}): {date_str} ({iso_date} {target_date:%A})"
         )
         self.logger.info("=" * 60)
 
@@ -427,10 +709,12 @@ class MingPaoArchiver:
             self.logger.info(f"關鍵詞: {', '.join(keywords)}")
 
         start_time = time.time()
-        articles_to_process = self._get_urls_to_process(target_date, mode)
+        articles_to_process, total_generated = self._get_urls_to_process(
+            target_date, mode
+        )
 
         if not articles_to_process:
-            filtered = 100  # Placeholder
+            filtered = total_generated
             return {
                 "date": date_str,
                 "found": 0,
@@ -441,25 +725,20 @@ class MingPaoArchiver:
                 "time": time.time() - start_time,
             }
 
-        # Process articles
-        found = archived = failed = 0
-
-        if mode == "all":
-            found, archived, failed = self._archive_sequential(
-                articles_to_process, date_str, mode
-            )
+        # Process articles (the shared rate limiter paces both paths)
+        if self.config["parallel"]["enabled"]:
+            archive_articles = self._archive_parallel
         else:
-            found, archived, failed = self._archive_sequential(
-                articles_to_process, date_str, mode
-            )
+            archive_articles = self._archive_sequential
+        found, archived, failed, not_found = archive_articles(
+            articles_to_process, date_str, mode
+        )
+        self.wayback_archiver.drain_stats()
 
         # Record progress
         execution_time = time.time() - start_time
         filtered = (
-            len(self.url_generator.generate_article_urls(target_date))
-            - len(articles_to_process)
-            if mode == "keywords"
-            else 0
+            total_generated - len(articles_to_process) if mode == "keywords" else 0
         )
 
         daily_progress = DailyProgress(
@@ -467,7 +746,7 @@ class MingPaoArchiver:
             articles_found=found,
             articles_archived=archived,
             articles_failed=failed,
-            articles_not_found=0 if mode == "all" else 0,
+            articles_not_found=not_found,
             keywords_filtered=filtered,
             execution_time=execution_time,
             completed_at=datetime.now(),
@@ -478,10 +757,13 @@ class MingPaoArchiver:
         self.logger.info(f"完成: {date_str}")
         if mode == "keywords":
             self.logger.info(
-                f"  找到: {found} | 成功: {archived} | 失敗: {failed} | 過濾: {filtered}"
+                f"  找到: {found} | 成功: {archived} | 失敗: {failed} | "
+                f"不存在: {not_found} | 過濾: {filtered}"
             )
         else:
-            self.logger.info(f"  找到: {found} | 成功: {archived} | 失敗: {failed}")
+            self.logger.info(
+                f"  找到: {found} | 成功: {archived} | 失敗: {failed} | 不存在: {not_found}"
+            )
         self.logger.info(f"  時間: {execution_time:.1f} 秒")
         self.logger.info("=" * 60)
 
@@ -490,117 +772,234 @@ class MingPaoArchiver:
             "found": found,
             "archived": archived,
             "failed": failed,
-            "not_found": 0,
+            "not_found": not_found,
             "filtered": filtered,
             "time": execution_time,
         }
 
-    def _archive_sequential(
-        self, articles: List[Dict], date_str: str, mode: str
-    ) -> Tuple[int, int, int]:
-        """Sequential archiving of articles with batch saves (OPTIMIZED)"""
-        found = archived = failed = 0
-        total = len(articles)
-        batch_records = []  # Collect records for batch insert (OPTIMIZATION)
-        batch_size = 20  # Save every 20 articles
-        html_cache = {}  # Cache HTML fetches to avoid redundant fetches (OPTIMIZATION)
-
-        for i, article in enumerate(articles):
-            url = article["url"]
-            found += 1
-
-            # Use Wayback archiver
-            result = self.wayback_archiver.archive_url(url, self.config["archiving"])
-
-            if mode == "keywords":
-                # Save keyword result
-                article_record = ArchiveRecord(
-                    article_url=url,
-                    wayback_url=result.wayback_url,
-                    archive_date=date_str,
-                    status=result.status,
-                    http_status=result.http_status,
-                    error_message=result.error,
-                    matched_keywords=",".join(article.get("matched_keywords", [])),
-                    checked_wayback=True,
-                    title_search_only=article.get("title_search_only", False),
-                    article_title=article.get("title"),
-                )
-                batch_records.append(article_record)
+    def _archive_article(
+        self, article: Dict, date_str: str, mode: str
+    ) -> Tuple[ArchiveRecord, bool]:
+        """
+        Archive one article and build its database record (thread-safe)
 
-                if result:
-                    archived += 1
-                    self.logger.debug(
-                        f"✅ {', '.join(article.get('matched_keywords', []))}: {url[:60]}..."
-                    )
-                else:
-                    failed += 1
-            else:
-                # Extract title for all articles (prefer Wayback if available)
-                title = None
-                try:
-                    # Check cache first (OPTIMIZATION: avoid duplicate fetches)
-                    if url in html_cache:
-                        html = html_cache[url]
-                    else:
-                        html, _ = self.fetch_html_content(url)
-                        if html:
-                            html_cache[url] = html  # Cache for potential reuse
+        Returns:
+            Tuple of (record to save, whether archiving succeeded)
+        """
+        url = article["url"]
+
+        # Use Wayback archiver
+        result = self.wayback_archiver.archive_url(url, self.config["archiving"])
 
+        if mode == "keywords":
+            # Save keyword result
+            article_record = self.repository.create_keyword_record(
+                url,
+                result,
+                date_str,
+                ",".join(article.get("matched_keywords", [])),
+                article.get("title_search_only", False),
+                article.get("title"),
+            )
+            if result:
+                self.logger.debug(
+                    f"✅ {', '.join(article.get('matched_keywords', []))}: {url[:60]}..."
+                )
+        else:
+            # Extract title for all articles unless the caller already has
+            # one, reusing the snapshot the archiver already downloaded
+            # before fetching the page again
+            title = article.get("title")
+            if not title:
+                try:
+                    html = result.snapshot_html
+                    if not html:
+                        html, _ = self.fetch_html_head(url)
                     if html:
                         title = self.extract_title_from_html(html)
                         self.logger.debug(f"Extracted title: {title[:50] if title else 'None'}...")
                 except Exception as e:
                     self.logger.debug(f"Failed to extract title for {url}: {str(e)}")
 
-                # Save regular result
-                article_record = ArchiveRecord(
-                    article_url=url,
-                    wayback_url=result.wayback_url,
-                    archive_date=date_str,
-                    status=result.status,
-                    http_status=result.http_status,
-                    error_message=result.error,
-                    checked_wayback=True,
-                    article_title=title,
-                )
+            # Save regular result
+            article_record = self.repository.create_regular_record(
+                url, result, date_str, title
+            )
+
+        return article_record, bool(result)
+
+    def _failed_record(
+        self, article: Dict, date_str: str, mode: str, error: Exception
+    ) -> ArchiveRecord:
+        """Build the record for an article whose archiving raised"""
+        url = article["url"]
+        result = ArchiveResult(status="error", error=str(error))
+        if mode == "keywords":
+            return self.repository.create_keyword_record(
+                url,
+                result,
+                date_str,
+                ",".join(article.get("matched_keywords", [])),
+                article.get("title_search_only", False),
+                article.get("title"),
+            )
+        return self.repository.create_regular_record(
+            url, result, date_str, article.get("title")
+        )
+
+    def _archive_sequential(
+        self, articles: List[Dict], date_str: str, mode: str
+    ) -> Tuple[int, int, int, int]:
+        """
+        Sequential archiving of articles with batch saves (OPTIMIZED)
+
+        Returns:
+            Tuple of (found, archived, failed, not_found) counts
+        """
+        found = archived = failed = not_found = 0
+        total = len(articles)
+        batch_records = []  # Collect records for batch insert (OPTIMIZATION)
+
+        try:
+            for i, article in enumerate(articles):
+                found += 1
+
+                article_record, success = self._archive_article(article, date_str, mode)
                 batch_records.append(article_record)
 
-                if result:
+                if success:
                     archived += 1
+                elif article_record.status == "not_found":
+                    not_found += 1
                 else:
                     failed += 1
 
-            # Batch save every N articles (OPTIMIZATION: reduces db operations)
-            if len(batch_records) >= batch_size or i == total - 1:
-                self.repository.save_archive_records_batch(batch_records)
-                batch_records = []
+                # Batch save every N articles (OPTIMIZATION: reduces db operations)
+                if len(batch_records) >= SAVE_BATCH_SIZE:
+                    self.repository.save_archive_records_batch(batch_records)
+                    batch_records.clear()
 
-            if found >= self.config["daily_limit"]:
-                self.logger.warning(f"達到每日限制: {self.config['daily_limit']}")
-                break
+                if found >= self.config["daily_limit"]:
+                    self.logger.warning(f"達到每日限制: {self.config['daily_limit']}")
+                    break
 
-            if i % 20 == 0 or i == total - 1:  # Log every 20 articles (OPTIMIZED: was every 10)
-                self.logger.info(f"進度: {i + 1}/{total} 篇已處理...")
+                if i % 20 == 0 or i == total - 1:  # Log every 20 articles (OPTIMIZED: was every 10)
+                    self.logger.info(f"進度: {i + 1}/{total} 篇已處理...")
+        finally:
+            # Flush the remainder, including the article that hit the daily
+            # limit, and whatever was archived before an error or Ctrl-C
+            self.repository.save_archive_records_batch(batch_records)
 
-        return found, archived, failed
+        return found, archived, failed, not_found
+
+    def _archive_parallel(
+        self, articles: List[Dict], date_str: str, mode: str
+    ) -> Tuple[int, int, int, int]:
+        """
+        Archive articles on a thread pool of parallel.max_workers
+
+        Requests overlap their network latency while the shared RateLimiter
+        keeps them spaced; records are batch-saved from this thread only.
+
+        Returns:
+            Tuple of (found, archived, failed, not_found) counts
+        """
+        daily_limit = self.config["daily_limit"]
+        if len(articles) > daily_limit:
+            self.logger.warning(f"達到每日限制: {daily_limit}")
+            articles = articles[:daily_limit]
+
+        found = archived = failed = not_found = 0
+        total = len(articles)
+        batch_records = []
+        first_error = None
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.config["parallel"]["max_workers"]
+            ) as executor:
+                futures = {
+                    executor.submit(self._archive_article, article, date_str, mode): article
+                    for article in articles
+                }
+                for future in as_completed(futures):
+                    found += 1
+
+                    try:
+                        article_record, success = future.result()
+                    except Exception as e:
+                        # Keep collecting: the other workers' snapshots must
+                        # still be recorded or the next run archives them again
+                        article = futures[future]
+                        self.logger.error(f"💥 存檔例外: {article['url']} - {str(e)}")
+                        article_record = self._failed_record(article, date_str, mode, e)
+                        success = False
+                        if first_error is None:
+                            first_error = e
+                    batch_records.append(article_record)
+
+                    if success:
+                        archived += 1
+                    elif article_record.status == "not_found":
+                        not_found += 1
+                    else:
+                        failed += 1
+
+                    if len(batch_records) >= SAVE_BATCH_SIZE:
+                        self.repository.save_archive_records_batch(batch_records)
+                        batch_records.clear()
+
+                    if found % 20 == 1 or found == total:
+                        self.logger.info(f"進度: {found}/{total} 篇已處理...")
+        finally:
+            # Flush the remainder, also when interrupted (e.g. Ctrl-C)
+            self.repository.save_archive_records_batch(batch_records)
+
+        if first_error is not None:
+            raise first_error
+
+        return found, archived, failed, not_found
 
     def archive_date_range(
-        self, start_date: datetime, end_date: datetime, mode: str = "all"
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        mode: str = "all",
+        rebuild_indexes: bool = False,
     ) -> Dict:
-        """Archive articles for a date range"""
+        """
+        Archive articles for a date range
+
+        With rebuild_indexes, secondary indexes are dropped for the run and
+        rebuilt once at the end, which speeds up large backfills.
+        """
         results = []
         current_date = start_date
 
-        while current_date <= end_date:
-            result = self.archive_date(current_date, mode)
-            results.append(result)
-            current_date += timedelta(days=1)
+        if self.config["parallel"]["enabled"]:
+            # Overlap the per-day index page round trips up front
+            dates = [
+                start_date + timedelta(days=offset)
+                for offset in range((end_date - start_date).days + 1)
+            ]
+            self.url_generator.prefetch(dates, self.config["parallel"]["max_workers"])
+
+        if rebuild_indexes:
+            self.repository.drop_analytical_indexes()
+        try:
+            while current_date <= end_date:
+                result = self.archive_date(current_date, mode)
+                results.append(result)
+                current_date += timedelta(days=1)
+        finally:
+            if rebuild_indexes:
+                self.repository.create_analytical_indexes()
 
         # Aggregate results
         total_found = sum(r["found"] for r in results)
         total_archived = sum(r["archived"] for r in results)
         total_failed = sum(r["failed"] for r in results)
+        total_not_found = sum(r["not_found"] for r in results)
         total_filtered = sum(r["filtered"] for r in results)
         total_time = sum(r["time"] for r in results)
 
@@ -611,6 +1010,7 @@ class MingPaoArchiver:
             "found": total_found,
             "archived": total_archived,
             "failed": total_failed,
+            "not_found": total_not_found,
             "filtered": total_filtered,
             "time": total_time,
             "daily_results": results,
@@ -649,6 +1049,8 @@ class MingPaoArchiver:
 
     def close(self):
         """Cleanup resources"""
+        self.session.close()
+        self.keyword_filter.close()
         self.repository.close()
 
 
@@ -662,8 +1064,10 @@ def parse_date(date_str: str) -> datetime:
     raise ValueError(f"Invalid date format: {date_str}")
 
 
-def main():
-    """Main entry point for command line usage"""
+def _build_parser():
+    """Build the command line parser (argparse is only imported for CLI use)"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="明報加拿大港聞 Wayback Machine 存檔工具 (Refactored)"
     )
@@ -674,11 +1078,27 @@ def main():
     parser.add_argument("--config", default="config.json", help="配置文件路徑")
     parser.add_argument("--report", action="store_true", help="僅生成報告")
     parser.add_argument("--daily-limit", type=int, help="覆蓋每日限制")
+    parser.add_argument(
+        "--strict-verify",
+        action="store_true",
+        help="存檔前以 HEAD 確認原網址存在 (預設由 Wayback 存檔結果判斷)",
+    )
+    parser.add_argument(
+        "--rebuild-indexes",
+        action="store_true",
+        help="日期範圍回填時先移除次要索引，完成後重建",
+    )
+    return parser
+
 
-    args = parser.parse_args()
+def main():
+    """Main entry point for command line usage"""
+    args = _build_parser().parse_args()
 
     # Initialize archiver
     archiver = MingPaoArchiver(args.config)
+    if args.strict_verify:
+        archiver.config["archiving"]["verify_first"] = True
 
     try:
         if args.report:
@@ -689,17 +1109,23 @@ def main():
         elif args.start and args.end:
             start_date = parse_date(args.start)
             end_date = parse_date(args.end)
-            archiver.archive_date_range(start_date, end_date)
+            archiver.archive_date_range(
+                start_date, end_date, rebuild_indexes=args.rebuild_indexes
+            )
         elif args.backdays:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=args.backdays)
-            archiver.archive_date_range(start_date, end_date)
+            archiver.archive_date_range(
+                start_date, end_date, rebuild_indexes=args.rebuild_indexes
+            )
         else:
             # Use config date range
             date_range = archiver.config["date_range"]
             start_date = parse_date(date_range["start"])
             end_date = parse_date(date_range["end"])
-            archiver.archive_date_range(start_date, end_date)
+            archiver.archive_date_range(
+                start_date, end_date, rebuild_indexes=args.rebuild_indexes
+            )
 
     except KeyboardInterrupt:
         print("\n⛔ 用戶中斷執行")
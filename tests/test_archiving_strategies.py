@@ -0,0 +1,215 @@
+"""Tests for archiving strategies"""
+
+import threading
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from archiving_strategies import (
+    BatchStrategy,
+    ParallelStrategy,
+    SequentialStrategy,
+    StrategyFactory,
+)
+from database_repository import ArchiveRepository
+from wayback_archiver import ArchiveResult
+
+
+class TestBatchStrategy:
+    """Test cases for BatchStrategy"""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        """Create repository backed by a temporary database"""
+        return ArchiveRepository(str(tmp_path / "test.db"))
+
+    @pytest.fixture
+    def archiver(self):
+        """Create a fake Wayback archiver"""
+        archiver = Mock()
+        archiver.config = {}
+        archiver.archive_url.side_effect = lambda url, config: ArchiveResult(
+            status="failed" if url.endswith("3") else "success",
+            wayback_url=f"https://web.archive.org/web/2/{url}",
+            http_status=200,
+        )
+        return archiver
+
+    def test_saves_each_batch_in_bulk(self, repository, archiver):
+        """Test that records are flushed once per batch, not once per article"""
+        articles = [{"url": f"http://example.com/{i}"} for i in range(5)]
+        repository.save_archive_record = Mock()
+        save_batch = Mock(wraps=repository.save_archive_records_batch)
+        repository.save_archive_records_batch = save_batch
+        stats = {}
+
+        found, archived, failed = BatchStrategy(batch_size=2).archive_articles(
+            articles, "20250101", archiver, repository, stats, threading.Lock()
+        )
+
+        assert (found, archived, failed) == (5, 4, 1)
+        assert stats["total_attempted"] == 5
+        repository.save_archive_record.assert_not_called()
+        assert [len(call.args[0]) for call in save_batch.call_args_list] == [2, 2, 1]
+        assert len(repository.get_archive_records_by_date("20250101")) == 5
+
+    def test_accepts_generator(self, repository, archiver):
+        """Test that articles can be streamed from a generator"""
+        articles = ({"url": f"http://example.com/{i}"} for i in range(3))
+
+        found, archived, failed = BatchStrategy(batch_size=2).archive_articles(
+            articles, "20250101", archiver, repository, {}, threading.Lock()
+        )
+
+        assert (found, archived, failed) == (3, 3, 0)
+
+    def test_checkpoints_wal_every_few_batches(self, repository, archiver):
+        """Test that the WAL is checkpointed every CHECKPOINT_EVERY_BATCHES batches"""
+        articles = [{"url": f"http://example.com/{i}"} for i in range(11)]
+        repository.checkpoint_wal = Mock(wraps=repository.checkpoint_wal)
+
+        BatchStrategy(batch_size=1).archive_articles(
+            articles, "20250101", archiver, repository, {}, threading.Lock()
+        )
+
+        assert repository.checkpoint_wal.call_count == 2
+
+    def test_reraises_article_source_errors(self, repository, archiver):
+        """Test that errors from the prefetching producer reach the caller"""
+
+        def articles():
+            yield {"url": "http://example.com/0"}
+            raise RuntimeError("index crawl failed")
+
+        with pytest.raises(RuntimeError, match="index crawl failed"):
+            BatchStrategy(batch_size=1).archive_articles(
+                articles(), "20250101", archiver, repository, {}, threading.Lock()
+            )
+
+    def test_saves_finished_records_when_archiving_raises(self, repository, archiver):
+        """Test that records already archived in a batch survive a later error"""
+        articles = [{"url": f"http://example.com/{i}"} for i in range(4)]
+        archive = archiver.archive_url.side_effect
+
+        def archive_url(url, config):
+            if url.endswith("2"):
+                raise RuntimeError("connection reset")
+            return archive(url, config)
+
+        archiver.archive_url.side_effect = archive_url
+
+        with pytest.raises(RuntimeError, match="connection reset"):
+            BatchStrategy(batch_size=4).archive_articles(
+                articles, "20250101", archiver, repository, {}, threading.Lock()
+            )
+
+        assert len(repository.get_archive_records_by_date("20250101")) == 2
+
+
+class TestParallelStrategy:
+    """Test cases for ParallelStrategy"""
+
+    def test_saves_results_in_bulk(self, tmp_path):
+        """Test that worker results are written with one bulk insert"""
+        repository = ArchiveRepository(str(tmp_path / "test.db"))
+        repository.save_archive_record = Mock()
+        archiver = Mock()
+        archiver.config = {}
+        archiver.archive_url.return_value = ArchiveResult(status="success")
+        articles = [{"url": f"http://example.com/{i}"} for i in range(4)]
+
+        found, archived, failed = ParallelStrategy(max_workers=2).archive_articles(
+            articles, "20250101", archiver, repository, {}, threading.Lock()
+        )
+
+        assert (found, archived, failed) == (4, 4, 0)
+        repository.save_archive_record.assert_not_called()
+        assert len(repository.get_archive_records_by_date("20250101")) == 4
+
+
+class TestSequentialStrategy:
+    """Test cases for SequentialStrategy"""
+
+    def test_merges_stats_once(self, tmp_path):
+        """Test that shared stats are updated under a single lock acquisition"""
+        repository = ArchiveRepository(str(tmp_path / "test.db"))
+        archiver = Mock()
+        archiver.config = {}
+        archiver.archive_url.return_value = ArchiveResult(status="success")
+        articles = [{"url": f"http://example.com/{i}"} for i in range(3)]
+        stats_lock = MagicMock()
+        stats = {"total_attempted": 2}
+
+        found, archived, failed = SequentialStrategy().archive_articles(
+            articles, "20250101", archiver, repository, stats, stats_lock
+        )
+
+        assert (found, archived, failed) == (3, 3, 0)
+        assert stats["total_attempted"] == 5
+        assert stats_lock.__enter__.call_count == 1
+        assert len(repository.get_archive_records_by_date("20250101")) == 3
+
+    def test_saves_finished_records_when_articles_raise(self, tmp_path):
+        """Test that buffered records are flushed when the article source fails"""
+        repository = ArchiveRepository(str(tmp_path / "test.db"))
+        archiver = Mock()
+        archiver.config = {}
+        archiver.archive_url.return_value = ArchiveResult(status="success")
+
+        def articles():
+            yield {"url": "http://example.com/0"}
+            yield {"url": "http://example.com/1"}
+            raise RuntimeError("content filter failed")
+
+        with pytest.raises(RuntimeError, match="content filter failed"):
+            SequentialStrategy().archive_articles(
+                articles(), "20250101", archiver, repository, {}, threading.Lock()
+            )
+
+        assert len(repository.get_archive_records_by_date("20250101")) == 2
+
+
+class TestStrategyFactory:
+    """Test cases for StrategyFactory"""
+
+    def test_reuses_strategy_instances(self):
+        """Test that equal settings return the same shared strategy"""
+        config = {"parallel": {"max_workers": 4}}
+
+        assert StrategyFactory.create_strategy("sequential") is (
+            StrategyFactory.create_strategy("sequential", config)
+        )
+        parallel = StrategyFactory.create_strategy("parallel", config)
+        assert parallel.max_workers == 4
+        assert parallel is StrategyFactory.create_strategy("parallel", config)
+        assert StrategyFactory.create_strategy("batch").batch_size == 500
+
+    @pytest.mark.parametrize(
+        "keywords, parallel, expected",
+        [
+            ({"enabled": True, "search_content": True}, {"enabled": True}, "sequential"),
+            ({"enabled": False}, {"enabled": True}, "parallel"),
+            ({"enabled": True}, {"enabled": True}, "sequential"),
+            ({}, {}, "sequential"),
+        ],
+    )
+    def test_default_strategy(self, keywords, parallel, expected):
+        """Test default strategy selection without touching the config"""
+        config = {"keywords": keywords, "parallel": parallel}
+
+        assert StrategyFactory.get_default_strategy(config) == expected
+        assert config == {"keywords": keywords, "parallel": parallel}
+
+    def test_default_strategy_follows_config_changes(self):
+        """Test that flags edited after a lookup are honored"""
+        config = {"keywords": {"enabled": False}, "parallel": {"enabled": True}}
+        assert StrategyFactory.get_default_strategy(config) == "parallel"
+
+        config["keywords"]["enabled"] = True
+        assert StrategyFactory.get_default_strategy(config) == "sequential"
+
+    def test_unknown_strategy(self):
+        """Test that unknown strategy types are rejected"""
+        with pytest.raises(ValueError):
+            StrategyFactory.create_strategy("bogus")
+
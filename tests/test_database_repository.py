@@ -0,0 +1,151 @@
+"""Tests for the database repository"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from database_repository import ArchiveRepository
+from wayback_archiver import ArchiveResult
+
+
+class TestArchiveRepository:
+    """Test cases for ArchiveRepository"""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        """Create repository backed by a temporary database"""
+        return ArchiveRepository(str(tmp_path / "test.db"))
+
+    def save_urls(self, repository, urls):
+        """Save a successful record for each URL"""
+        result = ArchiveResult(status="success", http_status=200)
+        repository.save_archive_records_batch(
+            [repository.create_regular_record(url, result, "20250101") for url in urls]
+        )
+
+    def test_get_existing_urls_beyond_parameter_limit(self, repository):
+        """Test that lookups larger than SQLite's variable limit still work"""
+        self.save_urls(repository, [f"http://example.com/{i}" for i in range(0, 40000, 7)])
+        urls = [f"http://example.com/{i}" for i in range(40000)]
+
+        existing = repository.get_existing_urls(urls)
+
+        assert existing == set(urls[::7])
+        assert repository.get_existing_urls(["http://example.com/1"]) == set()
+        assert repository.get_existing_urls([]) == set()
+
+    def test_close_closes_every_thread_connection(self, repository):
+        """Test that close() releases connections opened by worker threads"""
+        worker_conns = []
+        worker = threading.Thread(
+            target=lambda: worker_conns.append(repository._get_connection())
+        )
+        worker.start()
+        worker.join()
+        main_conn = repository._get_connection()
+
+        repository.close()
+
+        for conn in (main_conn, worker_conns[0]):
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+        # The repository stays usable and reconnects on demand
+        assert repository.get_existing_urls(["http://example.com/0"]) == set()
+
+    def test_save_archive_records_returns_row_count(self, repository):
+        """Test that bulk saves stream records and report rows written"""
+        result = ArchiveResult(status="success", http_status=200)
+        records = (
+            repository.create_regular_record(f"http://example.com/{i}", result, "20250101")
+            for i in range(3)
+        )
+
+        assert repository.save_archive_records(records) == 3
+        assert repository.save_archive_records([]) == 0
+        assert len(repository.get_archive_records_by_date("20250101")) == 3
+
+    def test_statistics_track_inserts_replacements_and_updates(self, repository):
+        """Test that trigger-maintained counts follow every kind of write"""
+        success = ArchiveResult(status="success", http_status=200)
+        failed = ArchiveResult(status="failed", error="timeout")
+        repository.save_archive_records_batch(
+            [
+                repository.create_regular_record("http://example.com/1", success, "20250101"),
+                repository.create_regular_record("http://example.com/2", failed, "20250101"),
+            ]
+        )
+        # INSERT OR REPLACE of an existing URL must not double count
+        repository.save_archive_record(
+            repository.create_regular_record("http://example.com/2", success, "20250101")
+        )
+        with repository._get_connection() as conn:
+            conn.execute(
+                "UPDATE archive_records SET status = 'exists' WHERE article_url = ?",
+                ("http://example.com/1",),
+            )
+
+        assert repository.get_archive_statistics() == {
+            "success": 1,
+            "exists": 1,
+            "total": 2,
+        }
+
+    def test_statistics_backfilled_for_existing_database(self, tmp_path):
+        """Test that a database created before the counts table gets backfilled"""
+        db_path = str(tmp_path / "legacy.db")
+        repository = ArchiveRepository(db_path)
+        self.save_urls(repository, ["http://example.com/1", "http://example.com/2"])
+        with repository._get_connection() as conn:
+            conn.execute("DROP TABLE archive_counts")
+        repository.close()
+
+        assert ArchiveRepository(db_path).get_archive_statistics() == {
+            "success": 2,
+            "total": 2,
+        }
+
+    def test_records_by_date_map_columns_by_name(self, repository):
+        """Test that stored records round-trip with every field in place"""
+        result = ArchiveResult(
+            status="success", wayback_url="https://web.archive.org/web/2/x", http_status=200
+        )
+        repository.save_archive_records_batch(
+            [
+                repository.create_keyword_record(
+                    "http://example.com/1", result, "20250101", "香港", True, "標題"
+                )
+            ]
+        )
+
+        (record,) = repository.iter_archive_records_by_date("20250101")
+
+        assert record.article_url == "http://example.com/1"
+        assert record.wayback_url == "https://web.archive.org/web/2/x"
+        assert record.status == "success"
+        assert record.http_status == 200
+        assert record.matched_keywords == "香港"
+        assert record.checked_wayback is True
+        assert record.title_search_only is True
+        assert record.article_title == "標題"
+
+    def test_analytical_indexes_drop_and_rebuild(self, repository):
+        """Test that backfills can drop secondary indexes but keep URL dedup"""
+
+        def index_names():
+            with repository._get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' "
+                    "AND tbl_name = 'archive_records' AND sql IS NOT NULL"
+                )
+                return {row[0] for row in rows}
+
+        assert index_names() == set(ArchiveRepository._ANALYTICAL_INDEXES)
+
+        assert repository.drop_analytical_indexes()
+        assert index_names() == set()
+        self.save_urls(repository, ["http://example.com/1", "http://example.com/1"])
+        assert repository.get_archive_statistics()["total"] == 1
+
+        assert repository.create_analytical_indexes()
+        assert index_names() == set(ArchiveRepository._ANALYTICAL_INDEXES)
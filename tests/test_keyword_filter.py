@@ -0,0 +1,328 @@
+"""Tests for keyword filtering"""
+
+import asyncio
+import contextlib
+import sqlite3
+import sys
+
+import pytest
+
+from keyword_filter import KeywordFilter
+
+
+class TestCheckKeywords:
+    """Test cases for KeywordFilter.check_keywords"""
+
+    @pytest.fixture
+    def keyword_filter(self):
+        """Create a keyword filter with no-op fetchers"""
+        return KeywordFilter(lambda url: (None, False), lambda html: None, {})
+
+    def test_returns_matches_in_configured_order(self, keyword_filter):
+        """Test that every matching term is reported once, in term order"""
+        text = "香港人在政治會議上討論香港"
+        terms = ["政治", "經濟", "香港", "香港人", "港人"]
+
+        assert keyword_filter.check_keywords(text, terms) == [
+            "政治",
+            "香港",
+            "香港人",
+            "港人",
+        ]
+
+    def test_case_sensitivity(self, keyword_filter):
+        """Test case-insensitive matching by default and exact when requested"""
+        text = "Hong Kong 立法會"
+
+        assert keyword_filter.check_keywords(text, ["hong kong"]) == ["hong kong"]
+        assert keyword_filter.check_keywords(text, ["hong kong"], True) == []
+        assert keyword_filter.check_keywords(text, ["Hong Kong"], True) == ["Hong Kong"]
+
+    def test_case_insensitive_matching_casefolds(self, keyword_filter):
+        """Test that caseless matching folds beyond lower(), e.g. sharp s"""
+        assert keyword_filter.check_keywords("明報 STRASSE 專訪", ["straße"]) == [
+            "straße"
+        ]
+
+    def test_normalizes_text_and_terms(self, keyword_filter):
+        """Test that NFD input and collapsed whitespace still match"""
+        assert keyword_filter.check_keywords("café  news", ["café news"]) == [
+            "café news"
+        ]
+
+    def test_collapses_any_whitespace(self, keyword_filter):
+        """Test that tabs, newlines and ideographic spaces collapse to one space"""
+        assert keyword_filter.normalize_cjkv_text("香港\u3000\t新聞\n\n 天氣") == (
+            "香港 新聞 天氣"
+        )
+        assert keyword_filter.normalize_cjkv_text("香港 新聞") == "香港 新聞"
+
+    def test_empty_inputs(self, keyword_filter):
+        """Test that empty text or terms never match"""
+        assert keyword_filter.check_keywords("", ["香港"]) == []
+        assert keyword_filter.check_keywords("香港", []) == []
+
+    def test_first_only(self, keyword_filter):
+        """Test that presence checks report a single matched term"""
+        text = "香港人在政治會議上討論香港"
+
+        assert keyword_filter.check_keywords(
+            text, ["經濟", "政治", "香港"], first_only=True
+        ) in (["政治"], ["香港"])
+        assert keyword_filter.check_keywords(text, ["經濟"], first_only=True) == []
+
+    def test_prepares_terms_once(self, keyword_filter, monkeypatch):
+        """Test that terms are normalized once per term list, not per text"""
+        calls = []
+        normalize = keyword_filter.normalize_cjkv_text
+        monkeypatch.setattr(
+            keyword_filter,
+            "normalize_cjkv_text",
+            lambda text: calls.append(text) or normalize(text),
+        )
+        terms = ["香港", "政治"]
+
+        for text in ("香港新聞", "政治新聞", "天氣"):
+            keyword_filter.check_keywords(text, terms)
+
+        assert calls.count("香港") == 1
+        assert calls.count("政治") == 1
+
+        keyword_filter.reload()
+        keyword_filter.check_keywords("香港", terms)
+        assert calls.count("香港") == 3  # Re-prepared, plus the text itself
+
+
+class TestContentSearch:
+    """Test cases for content keyword search"""
+
+    def test_ignores_keywords_inside_markup(self):
+        """Test that scripts, styles and attributes are not searched"""
+        html = (
+            "<html><head><title>天氣</title><style>.香港 {}</style>"
+            "<script type='text/javascript'>var tag = '政治';</script></head>"
+            "<body><a class='經濟' href='/news'>本地新聞</a><p>立法會 議員</p></body></html>"
+        )
+        keyword_filter = KeywordFilter(
+            lambda url: (html, False),
+            lambda html: "天氣",
+            {"terms": ["香港", "政治", "經濟", "立法會"]},
+        )
+
+        result = keyword_filter._process_url_sequential(
+            "http://example.com/1", keyword_filter.get_keywords(), False, True
+        )
+
+        assert result["matched_keywords"] == ["立法會"]
+        assert result["title_search_only"] is False
+
+
+class TestParallelFiltering:
+    """Test cases for title-only parallel filtering"""
+
+    PAGES = {
+        "http://example.com/1": "<title>香港新聞</title>",
+        "http://example.com/2": "<title>天氣</title>",
+        "http://example.com/3": None,
+    }
+
+    @staticmethod
+    def extract_title(html):
+        return html.removeprefix("<title>").removesuffix("</title>")
+
+    def test_threaded_fetcher(self):
+        """Test filtering with a blocking fetch function"""
+        keyword_filter = KeywordFilter(
+            lambda url: (self.PAGES[url], False), self.extract_title, {"terms": ["香港"]}
+        )
+
+        matches = keyword_filter.filter_urls_parallel(list(self.PAGES))
+
+        assert [match["url"] for match in matches] == ["http://example.com/1"]
+
+    def test_async_fetcher(self):
+        """Test that a coroutine fetch function runs on an event loop, bounded"""
+        in_flight = peak = 0
+
+        async def fetch(url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if url.endswith("4"):
+                raise ConnectionError("boom")
+            return self.PAGES.get(url, "<title>香港</title>"), True
+
+        keyword_filter = KeywordFilter(
+            fetch, self.extract_title, {"terms": ["香港"], "async_concurrency": 3}
+        )
+        urls = [f"http://example.com/{i}" for i in range(1, 9)]
+
+        matches = keyword_filter.filter_urls_parallel(urls)
+
+        assert sorted(match["url"] for match in matches) == [
+            url for url in urls if url[-1] not in "234"
+        ]
+        assert all(match["from_wayback"] for match in matches)
+        assert peak == 3
+
+    def test_async_fetch_session_spans_title_pass(self):
+        """Test that open_async_fetch serves the title pass, opened once"""
+        events = []
+
+        @contextlib.asynccontextmanager
+        async def open_fetch():
+            events.append("open")
+
+            async def fetch(url):
+                return self.PAGES[url], True
+
+            yield fetch
+            events.append("close")
+
+        keyword_filter = KeywordFilter(
+            lambda url: pytest.fail("sync fetcher used"),
+            self.extract_title,
+            {"terms": ["香港"]},
+            open_async_fetch=open_fetch,
+        )
+
+        matches = keyword_filter.filter_urls_parallel(list(self.PAGES))
+
+        assert [match["url"] for match in matches] == ["http://example.com/1"]
+        assert matches[0]["from_wayback"] is True
+        assert events == ["open", "close"]
+
+    def test_content_search_after_title_pass(self):
+        """Test that content search only covers title misses, without refetching"""
+        pages = {
+            "http://example.com/1": "<title>香港新聞</title>",
+            "http://example.com/2": "<title>天氣</title><p>香港</p>",
+            "http://example.com/3": "<title>天氣</title><p>晴</p>",
+        }
+        fetched = []
+        parsed = []
+
+        def fetch(url):
+            fetched.append(url)
+            return pages[url], False
+
+        def extract_title(html):
+            parsed.append(html)
+            return html.split("</title>")[0].removeprefix("<title>")
+
+        keyword_filter = KeywordFilter(
+            fetch,
+            extract_title,
+            {"enabled": True, "terms": ["香港"], "search_content": True},
+        )
+
+        matches = keyword_filter.filter_urls(list(pages))
+
+        assert sorted(fetched) == list(pages)
+        assert sorted(parsed) == sorted(pages.values())
+        assert {m["url"]: (m["title"], m["title_search_only"]) for m in matches} == {
+            "http://example.com/1": ("香港新聞", True),
+            "http://example.com/2": ("天氣", False),
+        }
+        assert not keyword_filter._pages
+        assert keyword_filter._pages_bytes == 0
+
+    def test_kept_pages_bounded_by_bytes(self, monkeypatch):
+        """Test that kept pages are evicted oldest first past the byte budget"""
+        page = "<title>天氣</title>" + "x" * 1000
+        monkeypatch.setattr("keyword_filter.PAGE_CACHE_BYTES", 2 * sys.getsizeof(page))
+        keyword_filter = KeywordFilter(
+            lambda url: (page, False), self.extract_title, {"terms": ["香港"]}
+        )
+
+        for i in range(3):
+            keyword_filter._keep_page(f"http://example.com/{i}", page, False, "天氣")
+
+        assert list(keyword_filter._pages) == [
+            "http://example.com/1",
+            "http://example.com/2",
+        ]
+        kept = keyword_filter._take_page("http://example.com/2")
+        assert kept == (page, False, "天氣")
+        assert keyword_filter._pages_bytes == sys.getsizeof(page)
+
+    def test_matches_stream_before_remaining_urls_fetched(self):
+        """Test that iter_filter_urls yields a match without fetching later URLs"""
+        fetched = []
+
+        def fetch(url):
+            fetched.append(url)
+            return self.PAGES[url], False
+
+        keyword_filter = KeywordFilter(
+            fetch,
+            self.extract_title,
+            {"enabled": True, "terms": ["香港"], "search_content": True},
+        )
+        matches = keyword_filter.iter_filter_urls_sequential(list(self.PAGES))
+
+        assert next(matches)["url"] == "http://example.com/1"
+        assert fetched == ["http://example.com/1"]
+
+
+class TestResultCache:
+    """Test cases for the on-disk keyword result cache"""
+
+    PAGES = TestParallelFiltering.PAGES
+
+    def make_filter(self, tmp_path, fetched, **config):
+        def fetch(url):
+            fetched.append(url)
+            return self.PAGES[url], False
+
+        return KeywordFilter(
+            fetch,
+            TestParallelFiltering.extract_title,
+            {"terms": ["香港"], "cache_path": str(tmp_path / "kw.db"), **config},
+        )
+
+    def test_rerun_skips_fetched_urls(self, tmp_path):
+        """Test that matches and non-matches persist, failed fetches do not"""
+        fetched = []
+        first = self.make_filter(tmp_path, fetched).filter_urls_parallel(list(self.PAGES))
+
+        fetched.clear()
+        second = self.make_filter(tmp_path, fetched).filter_urls_parallel(list(self.PAGES))
+
+        assert second == first
+        assert fetched == ["http://example.com/3"]
+
+    def test_settings_change_invalidates(self, tmp_path):
+        """Test that results are keyed by the filter settings"""
+        fetched = []
+        self.make_filter(tmp_path, fetched).filter_urls_sequential(list(self.PAGES))
+
+        fetched.clear()
+        self.make_filter(tmp_path, fetched, terms=["天氣"]).filter_urls_sequential(
+            list(self.PAGES)
+        )
+
+        assert len(fetched) == len(self.PAGES)
+
+    def test_expired_entries_are_refetched(self, tmp_path):
+        """Test that entries older than cache_ttl are ignored"""
+        fetched = []
+        self.make_filter(tmp_path, fetched, cache_ttl=0).filter_urls_sequential(
+            ["http://example.com/1"]
+        )
+        self.make_filter(tmp_path, fetched, cache_ttl=0).filter_urls_sequential(
+            ["http://example.com/1"]
+        )
+
+        assert fetched == ["http://example.com/1"] * 2
+
+    def test_close_closes_cache_database(self, tmp_path):
+        """Test that closing the filter releases the cache connection"""
+        keyword_filter = self.make_filter(tmp_path, [])
+
+        keyword_filter.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            keyword_filter.cache._conn.execute("SELECT 1")
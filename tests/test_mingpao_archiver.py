@@ -0,0 +1,76 @@
+"""Tests for MingPaoArchiver URL selection and daily counts"""
+
+import json
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from keyword_filter import DEFAULT_CACHE_TTL
+from mingpao_hkga_archiver import MingPaoArchiver
+from wayback_archiver import ArchiveResult
+
+
+URLS = [f"http://example.com/{i}" for i in range(3)]
+
+
+class TestMingPaoArchiver:
+    """Test cases for MingPaoArchiver"""
+
+    @pytest.fixture
+    def archiver(self, tmp_path):
+        """Create archiver with a temporary config and database"""
+        config = {
+            "database": {"path": str(tmp_path / "test.db")},
+            "logging": {"level": "WARNING", "file": str(tmp_path / "test.log")},
+            "archiving": {"rate_limit_delay": 0.01, "verify_first": True},
+            "parallel": {"enabled": False, "max_workers": 1},
+        }
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config))
+
+        archiver = MingPaoArchiver(str(config_path))
+        archiver.url_generator.generate_article_urls = Mock(return_value=URLS)
+        yield archiver
+        archiver.close()
+
+    def test_verify_first_keeps_article_dicts(self, archiver):
+        """Test that verification filters articles without re-wrapping them"""
+        archiver.check_url_exists = Mock(side_effect=lambda url: url != URLS[1])
+
+        articles, generated = archiver._get_urls_to_process(datetime(2025, 1, 1))
+
+        assert articles == [{"url": URLS[0]}, {"url": URLS[2]}]
+        assert generated == 3
+
+    def test_not_found_counted_in_daily_progress(self, archiver):
+        """Test that 404s from the save API are reported apart from failures"""
+        archiver.config["archiving"]["verify_first"] = False
+        statuses = {URLS[0]: "success", URLS[1]: "not_found", URLS[2]: "failed"}
+        archiver.wayback_archiver.archive_url = Mock(
+            side_effect=lambda url, config: ArchiveResult(statuses[url])
+        )
+        archiver.fetch_html_head = Mock(return_value=(None, False))
+
+        result = archiver.archive_date(datetime(2025, 1, 1))
+
+        assert (result["archived"], result["failed"], result["not_found"]) == (1, 1, 1)
+        progress = archiver.repository.get_daily_progress("20250101")
+        assert progress.articles_not_found == 1
+        assert progress.articles_failed == 1
+
+    def test_keyword_cache_expires_by_default(self, tmp_path):
+        """Test that a cache_path without cache_ttl gets the shared default TTL"""
+        config = {
+            "database": {"path": str(tmp_path / "test.db")},
+            "logging": {"level": "WARNING", "file": str(tmp_path / "test.log")},
+            "keywords": {"cache_path": str(tmp_path / "kw.db")},
+        }
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config))
+
+        archiver = MingPaoArchiver(str(config_path))
+        try:
+            assert archiver.keyword_filter.cache.ttl == DEFAULT_CACHE_TTL
+        finally:
+            archiver.close()
@@ -1,5 +1,7 @@
-"""Tests for URL validation"""
+"""Tests for the token bucket RateLimiter"""
 
+import asyncio
+import threading
 import time
 from mingpao_hkga_archiver import RateLimiter
 
@@ -9,7 +11,7 @@ class TestRateLimiter:
 
     def test_rate_limiter_allows_single_request(self):
         """Test that single request completes without delay"""
-        limiter = RateLimiter(delay=0.1, max_burst=1)
+        limiter = RateLimiter(rate_per_sec=10, capacity=1)
         start = time.time()
         limiter.acquire()
         elapsed = time.time() - start
@@ -17,7 +19,7 @@ class TestRateLimiter:
 
     def test_rate_limiter_enforces_delay(self):
         """Test that delay is enforced between requests"""
-        limiter = RateLimiter(delay=1.0, max_burst=1)
+        limiter = RateLimiter(rate_per_sec=1, capacity=1)
         start = time.time()
         limiter.acquire()
         limiter.acquire()
@@ -26,8 +28,8 @@ class TestRateLimiter:
         assert elapsed < 1.5, f"Elapsed {elapsed}s, expected < 1.5s"
 
     def test_rate_limiter_allows_burst(self):
-        """Test that max_burst allows multiple immediate requests"""
-        limiter = RateLimiter(delay=1.0, max_burst=3)
+        """Test that capacity allows multiple immediate requests"""
+        limiter = RateLimiter(rate_per_sec=1, capacity=3)
         start = time.time()
         limiter.acquire()
         limiter.acquire()
@@ -37,7 +39,7 @@ class TestRateLimiter:
 
     def test_rate_limiter_refills_after_burst(self):
         """Test that tokens refill after delay"""
-        limiter = RateLimiter(delay=0.5, max_burst=2)
+        limiter = RateLimiter(rate_per_sec=2, capacity=2)
         start = time.time()
         limiter.acquire()  # Uses 1 token
         limiter.acquire()  # Uses 2nd token (burst exhausted)
@@ -49,9 +51,51 @@ class TestRateLimiter:
 
     def test_rate_limiter_zero_delay(self):
         """Test limiter with zero delay"""
-        limiter = RateLimiter(delay=0.01, max_burst=5)  # Use small delay instead of 0
+        limiter = RateLimiter(rate_per_sec=100, capacity=5)  # Near-unlimited rate
         start = time.time()
         for _ in range(5):
             limiter.acquire()
         elapsed = time.time() - start
         assert elapsed < 0.5, f"Near-zero delay test took {elapsed}s"
+
+    def test_rate_limiter_spaces_concurrent_callers(self):
+        """Test that concurrent callers are released one delay apart"""
+        limiter = RateLimiter(rate_per_sec=5, capacity=1)
+        released = []
+        lock = threading.Lock()
+
+        def worker():
+            limiter.acquire()
+            with lock:
+                released.append(time.time())
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        released.sort()
+        gaps = [b - a for a, b in zip(released, released[1:])]
+        assert all(gap >= 0.15 for gap in gaps), f"Gaps {gaps}"
+        assert released[-1] - start < 0.6
+
+    def test_rate_limiter_async_spaces_tasks(self):
+        """Test that acquire_async paces tasks on one event loop"""
+        limiter = RateLimiter(rate_per_sec=5, capacity=1)
+        released = []
+
+        async def worker():
+            await limiter.acquire_async()
+            released.append(time.time())
+
+        async def main():
+            await asyncio.gather(*(worker() for _ in range(3)))
+
+        start = time.time()
+        asyncio.run(main())
+
+        gaps = [b - a for a, b in zip(released, released[1:])]
+        assert all(gap >= 0.15 for gap in gaps), f"Gaps {gaps}"
+        assert released[-1] - start < 0.6
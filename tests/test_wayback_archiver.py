@@ -0,0 +1,62 @@
+"""Tests for Wayback archiver statistics"""
+
+import threading
+from unittest.mock import Mock
+
+from wayback_archiver import WaybackArchiver
+
+
+class TestStats:
+    """Test cases for per-thread statistics counters"""
+
+    def test_drain_merges_thread_counts_once(self):
+        """Test that counts from every thread reach the shared dict exactly once"""
+        stats = {"successful": 0}
+        archiver = WaybackArchiver(Mock(), stats_dict=stats)
+
+        def work():
+            for _ in range(100):
+                archiver._update_stats("successful")
+            archiver._update_stats("failed")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert stats == {"successful": 0}
+        assert archiver.drain_stats() is stats
+        assert stats == {"successful": 400, "failed": 4}
+
+        archiver._update_stats("successful")
+        archiver.drain_stats()
+        assert stats == {"successful": 401, "failed": 4}
+
+    def test_drain_forgets_exited_threads(self):
+        """Test that counters of finished worker threads are not kept forever"""
+        archiver = WaybackArchiver(Mock())
+
+        for _ in range(3):
+            thread = threading.Thread(target=archiver._update_stats, args=("failed",))
+            thread.start()
+            thread.join()
+            archiver.drain_stats()
+
+        assert archiver.stats == {"failed": 3}
+        assert archiver._counters == []
+
+
+class TestSaveResponses:
+    """Test cases for interpreting save API responses"""
+
+    def test_origin_404_is_not_found(self):
+        """Test that a 404 save with no snapshot is reported as not_found"""
+        make_request = Mock(return_value=Mock(status_code=404, headers={}))
+        archiver = WaybackArchiver(make_request)
+
+        result = archiver._save_via_http("http://example.com/1", {"timeout": 5})
+
+        assert result.status == "not_found"
+        assert not result
+        assert archiver.drain_stats() == {"not_found": 1}
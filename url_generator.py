@@ -11,8 +11,9 @@ Provides different strategies for generating and discovering article URLs:
 
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List
+from typing import Dict, List
 from abc import ABC, abstractmethod
 import logging
 
@@ -36,6 +37,11 @@ class IndexBasedStrategy(URLGenerationStrategy):
     - Automatically discovers new URL patterns
     """
 
+    # Article links in the index page's listing sections. Matched on the raw
+    # bytes: links are ASCII, so the Big5 page never needs decoding (and
+    # response.text may run charset detection over the whole page)
+    ARTICLE_HREF_PATTERN = re.compile(rb'href="([^"]*htm/News/\d{8}/HK-[^"]+_r\.htm)"')
+
     def __init__(self, base_url: str, request_func):
         self.base_url = base_url
         self.make_request = request_func
@@ -66,10 +72,10 @@ class IndexBasedStrategy(URLGenerationStrategy):
             article_urls = set()
 
             # Find all href attributes in listing sections
-            pattern = r'href="([^"]*htm/News/\d{8}/HK-[^"]+_r\.htm)"'
-            matches = re.findall(pattern, response.text)
+            matches = self.ARTICLE_HREF_PATTERN.findall(response.content)
 
-            for relative_path in matches:
+            for match in matches:
+                relative_path = match.decode("ascii", errors="replace")
                 # Skip index pages
                 if "index" in relative_path.lower():
                     continue
@@ -165,6 +171,34 @@ class URLGenerator:
         self.index_strategy = IndexBasedStrategy(base_url, request_func)
         self.brute_force_strategy = BruteForceStrategy(base_url)
 
+        # Index results fetched ahead of time by prefetch, keyed by YYYYMMDD
+        self._prefetched: Dict[str, List[str]] = {}
+
+    def prefetch(self, dates: List[datetime], max_workers: int) -> int:
+        """
+        Fetch the index pages for several dates concurrently
+
+        Results are held until generate_article_urls asks for that date, so
+        a date range pays overlapping rather than summed round trips.
+
+        Args:
+            dates: Dates whose index pages to fetch
+            max_workers: Concurrent index page requests
+
+        Returns:
+            Number of dates whose index page listed articles
+        """
+        found = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.index_strategy.generate_urls, dates)
+            for target_date, urls in zip(dates, results):
+                # Empty lists are kept too: that date falls back to brute force
+                self._prefetched[target_date.strftime("%Y%m%d")] = urls
+                found += bool(urls)
+
+        self.logger.info(f"預先爬取 {len(dates)} 個索引頁，{found} 個有文章")
+        return found
+
     def generate_article_urls(self, target_date: datetime) -> List[str]:
         """
         Generate article URLs using the best available strategy
@@ -176,7 +210,9 @@ class URLGenerator:
             List of article URLs
         """
         # Try index-based approach first (recommended)
-        urls = self.index_strategy.generate_urls(target_date)
+        urls = self._prefetched.pop(target_date.strftime("%Y%m%d"), None)
+        if urls is None:
+            urls = self.index_strategy.generate_urls(target_date)
 
         if urls:
             return urls
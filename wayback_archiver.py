@@ -12,7 +12,8 @@ Handles saving URLs to Internet Archive Wayback Machine using:
 import time
 import threading
 import random
-from typing import Dict, Optional, Callable
+from collections import Counter
+from typing import Dict, List, Optional, Callable, Tuple
 import logging
 
 
@@ -26,12 +27,16 @@ class ArchiveResult:
         http_status: Optional[int] = None,
         error: Optional[str] = None,
         retry_count: int = 0,
+        snapshot_html: Optional[bytes] = None,
     ):
-        self.status = status  # success, exists, failed, timeout, rate_limited, error
+        self.status = status  # success, exists, failed, not_found, timeout, rate_limited, error
         self.wayback_url = wayback_url
         self.http_status = http_status
         self.error = error
         self.retry_count = retry_count
+        # Raw snapshot page when one was already fetched, so callers can
+        # read the title from it instead of requesting the page again
+        self.snapshot_html = snapshot_html
 
     def to_dict(self) -> Dict:
         """Convert to dictionary format for backward compatibility"""
@@ -58,10 +63,14 @@ class WaybackArchiver:
     - Check existing archives with internetarchive library
     - Rate limiting through external limiter
     - Comprehensive error handling and retries
-    - Thread-safe statistics tracking
+    - Thread-safe statistics tracking (per-thread counters, see drain_stats)
     """
 
     WAYBACK_SAVE_URL = "https://web.archive.org/save/{url}"
+    # Browser headers for save and snapshot requests, built once
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    }
 
     def __init__(
         self,
@@ -76,20 +85,58 @@ class WaybackArchiver:
         Args:
             make_request: Rate-limited HTTP request function
             rate_limiter: Optional rate limiter object
-            stats_dict: Dictionary to track statistics
-            stats_lock: Lock for thread-safe statistics updates
+            stats_dict: Dictionary that drain_stats adds the counts into
+            stats_lock: Lock guarding stats_dict
         """
         self.make_request = make_request
         self.rate_limiter = rate_limiter
-        self.stats = stats_dict or {}
+        self.stats = stats_dict if stats_dict is not None else {}
         self.stats_lock = stats_lock or threading.Lock()
         self.logger = logging.getLogger(__name__)
 
+        # Each thread counts into its own Counter, so archive workers never
+        # contend on stats_lock; drain_stats folds them into self.stats and
+        # forgets the Counters of threads that have exited
+        self._local = threading.local()
+        self._counters: List[Tuple[threading.Thread, Counter]] = []
+        self._drained: Counter = Counter()
+
     def _update_stats(self, key: str, increment: int = 1):
-        """Thread-safe statistics update"""
-        if self.stats_lock:
+        """Count into this thread's Counter (lock-free after first use)"""
+        counter = getattr(self._local, "counter", None)
+        if counter is None:
+            counter = self._local.counter = Counter()
             with self.stats_lock:
-                self.stats[key] = self.stats.get(key, 0) + increment
+                self._counters.append((threading.current_thread(), counter))
+        counter[key] += increment
+
+    def drain_stats(self) -> Dict:
+        """
+        Add counts made since the last drain into the shared stats dict
+
+        Workers only ever write their own Counter; this takes a snapshot of
+        each and applies the difference from what was already drained.
+        Counters of exited threads are final, so they are drained one last
+        time and dropped (each run's executor starts fresh worker threads).
+
+        Returns:
+            The updated stats dict
+        """
+        with self.stats_lock:
+            live_totals = Counter()
+            exited_totals = Counter()
+            live = []
+            for thread, counter in self._counters:
+                if thread.is_alive():
+                    live.append((thread, counter))
+                    live_totals.update(dict(counter))
+                else:
+                    exited_totals.update(dict(counter))
+            for key, count in (live_totals + exited_totals - self._drained).items():
+                self.stats[key] = self.stats.get(key, 0) + count
+            self._counters = live
+            self._drained = live_totals
+        return self.stats
 
     def _check_existing_archive(self, url: str) -> Optional[ArchiveResult]:
         """
@@ -139,13 +186,9 @@ class WaybackArchiver:
         self.logger.debug(f"🔄 使用 HTTP 存檔: {url}")
         wayback_target = self.WAYBACK_SAVE_URL.format(url=url)
 
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-
         try:
             response = self.make_request(
-                "POST", wayback_target, timeout=config["timeout"], headers=headers
+                "POST", wayback_target, timeout=config["timeout"], headers=self.HEADERS
             )
 
             # Handle successful save
@@ -169,6 +212,15 @@ class WaybackArchiver:
                 if fallback_result:
                     return fallback_result
 
+                # The save API could not fetch the origin: the save itself
+                # verifies existence, so no HEAD pre-check is needed
+                if response.status_code == 404:
+                    self.logger.info(f"🔍 原網址不存在: {url}")
+                    self._update_stats("not_found")
+                    return ArchiveResult(
+                        status="not_found", http_status=404, error="HTTP 404"
+                    )
+
                 self.logger.warning(f"⚠️ HTTP 存檔失敗 ({response.status_code}): {url}")
                 self._update_stats("failed")
                 return ArchiveResult(
@@ -216,18 +268,18 @@ class WaybackArchiver:
     ) -> Optional[ArchiveResult]:
         """Fallback check if URL was archived despite non-success response"""
         wayback_check = f"https://web.archive.org/web/2/{url}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
 
         try:
             check_resp = self.make_request(
-                "GET", wayback_check, timeout=config["timeout"], headers=headers
+                "GET", wayback_check, timeout=config["timeout"], headers=self.HEADERS
             )
             if check_resp.status_code == 200:
                 self._update_stats("already_archived")
                 return ArchiveResult(
-                    status="success", wayback_url=wayback_check, http_status=200
+                    status="success",
+                    wayback_url=wayback_check,
+                    http_status=200,
+                    snapshot_html=check_resp.content,
                 )
         except Exception:
             pass  # Fallback check failed, continue with original error